@@ -142,6 +142,12 @@ def main() -> None:
         p_download.add_argument("--repo", "--repoid", "-r", nargs="*", help="Repository names")
         p_download.add_argument("--downloaddir", "-x", type=str)
         p_download.add_argument("--destdir", type=str)
+        p_download.add_argument(
+            "--hardlink",
+            action="store_true",
+            help="Hard-link files into --destdir instead of copying them when possible "
+            "(the linked file is shared with --downloaddir)",
+        )
         p_download.add_argument("--resolve", action="store_true", dest="resolve_flag")
         p_download.add_argument(
             "--recurse",
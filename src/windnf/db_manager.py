@@ -7,11 +7,11 @@ import sqlite3
 import tempfile
 import uuid
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
 
 from .config import Config
 from .logger import setup_logger
-from .nevra import NEVRA
+from .nevra import NEVRA, rpmvercmp
 
 _logger = logging.getLogger(__name__)
 
@@ -28,10 +28,16 @@ class DbManager:
     def __init__(self, config: Config, schema_path: Optional[Union[str, Path]] = None):
         self.config = config
         self.db_path = Path(self.config.db_path)
-        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        # uri=True lets ATTACH take "file:...?mode=ro" URIs; plain paths are unaffected.
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False, uri=True)
         # Use Row for dict-like access
         self.conn.row_factory = sqlite3.Row
+        # version/release ordering for ORDER BY ... COLLATE rpmvercmp
+        self.conn.create_collation("rpmvercmp", rpmvercmp)
         self._configure_pragmas()
+        self._deferred_indexes: List[Tuple[str, str]] = []
+        self._saved_cache_size: Optional[int] = None
+        self._saved_mmap_size: Optional[int] = None
 
         # load schema if present
         schema_file = Path(schema_path) if schema_path else (Path(__file__).parent / "schema.sql")
@@ -107,6 +113,38 @@ class DbManager:
         row = self.conn.execute(query, (identifier,)).fetchone()
         return dict(row) if row else None
 
+    def get_repos_by_ids(self, ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Retrieve several repositories in one query. Returns {id: repo_row} for the ids that exist.
+        """
+        ids = list(dict.fromkeys(int(i) for i in ids))
+        if not ids:
+            return {}
+        q = f"SELECT * FROM repositories WHERE id IN ({','.join('?' for _ in ids)})"
+        return {int(r["id"]): dict(r) for r in self.conn.execute(q, ids)}
+
+    def get_repos(self, identifiers: Iterable[Union[str, int]]) -> Dict[Union[str, int], Dict[str, Any]]:
+        """
+        Batched get_repo: {identifier: repo_row} for each identifier (name, id or numeric string) that exists.
+        """
+        by_id: Dict[int, List[Union[str, int]]] = {}
+        by_name: List[str] = []
+        for ident in dict.fromkeys(identifiers):
+            try:
+                by_id.setdefault(int(ident), []).append(ident)
+            except ValueError:
+                by_name.append(ident)
+
+        out: Dict[Union[str, int], Dict[str, Any]] = {}
+        for repo_id, row in self.get_repos_by_ids(by_id).items():
+            for ident in by_id[repo_id]:
+                out[ident] = row
+        if by_name:
+            q = f"SELECT * FROM repositories WHERE name IN ({','.join('?' for _ in by_name)})"
+            for r in self.conn.execute(q, by_name):
+                out[r["name"]] = dict(r)
+        return out
+
     def delete_repo(self, name_or_id: Union[str, int]) -> bool:
         if isinstance(name_or_id, int):
             row = self.conn.execute("SELECT id FROM repositories WHERE id=?", (name_or_id,)).fetchone()
@@ -118,6 +156,13 @@ class DbManager:
             self.conn.execute("DELETE FROM repositories WHERE id=?", (row["id"],))
         return True
 
+    def delete_repos(self, repo_ids: Iterable[int]) -> None:
+        """
+        Delete several repositories (and, by cascade, their packages) in a single transaction.
+        """
+        with self.conn:
+            self.conn.executemany("DELETE FROM repositories WHERE id=?", [(int(i),) for i in repo_ids])
+
     def link_source(self, binary_repo: str, source_repo: str) -> None:
         binary_repo_row = self.get_repo(binary_repo)
         source_repo_row = self.get_repo(source_repo)
@@ -150,13 +195,17 @@ class DbManager:
         Insert a single package into packages. pkg is a dict of columns (excluding pkgKey).
         Returns pkgKey (lastrowid).
         """
+        with self.conn:
+            return self._insert_package_row(repo_id, pkg)
+
+    def _insert_package_row(self, repo_id: int, pkg: Dict[str, Any]) -> int:
+        # No commit here: callers own the transaction.
         data = dict(pkg)
         data["repo_id"] = repo_id
         cols = list(data.keys())
         placeholders = ", ".join("?" for _ in cols)
         sql = f"INSERT INTO packages ({','.join(cols)}) VALUES ({placeholders})"
-        with self.conn:
-            cur = self.conn.execute(sql, tuple(data[c] for c in cols))
+        cur = self.conn.execute(sql, tuple(data[c] for c in cols))
         return int(cur.lastrowid)
 
     def insert_relations(self, table: str, pkgKey: int, items: Iterable[Dict[str, Any]]) -> None:
@@ -191,6 +240,75 @@ class DbManager:
         with self.conn:
             self.conn.executemany(sql, data)
 
+    # -------------------------
+    # Bulk import tuning
+    # -------------------------
+    # Indexes dropped for the duration of a bulk import into an empty DB and rebuilt once afterwards.
+    # pkgKey indexes on relation tables are kept: the `removals` trigger relies on them.
+    BULK_DEFERRED_INDEXES = (
+        "packagename",
+        "packagename_nocase",
+        "packagesummary_nocase",
+        "packageId",
+        "filenames",
+        "requiresname",
+        "providesname",
+    )
+
+    # Page cache and mmap window used during a bulk import, in bytes
+    _BULK_CACHE_BYTES = 256 * 1024 * 1024
+    _BULK_MMAP_BYTES = 256 * 1024 * 1024
+
+    def _cache_bytes(self, cache_size: int) -> int:
+        # positive cache_size is a page count, negative is -KiB
+        if cache_size < 0:
+            return -cache_size * 1024
+        return cache_size * self.conn.execute("PRAGMA page_size").fetchone()[0]
+
+    def begin_bulk_import(self) -> None:
+        """
+        Prepare the DB for a large import: a page cache and mmap window of at least 256 MiB and,
+        when the package tables are still empty, deferred maintenance of secondary indexes
+        (see BULK_DEFERRED_INDEXES).
+        """
+        cache_size = self.conn.execute("PRAGMA cache_size").fetchone()[0]
+        if self._cache_bytes(cache_size) < self._BULK_CACHE_BYTES:
+            self._saved_cache_size = cache_size
+            self.conn.execute(f"PRAGMA cache_size=-{self._BULK_CACHE_BYTES // 1024}")
+        row = self.conn.execute("PRAGMA mmap_size").fetchone()
+        # no row when SQLite is built without mmap support
+        if row is not None and row[0] < self._BULK_MMAP_BYTES:
+            self._saved_mmap_size = row[0]
+            self.conn.execute(f"PRAGMA mmap_size={self._BULK_MMAP_BYTES}")
+
+        self._deferred_indexes = []
+        # Rebuilding covers whole tables, not just the new rows: once other repos are loaded,
+        # updating the indexes in place is cheaper than rebuilding them after every import.
+        if self.conn.execute("SELECT EXISTS (SELECT 1 FROM packages)").fetchone()[0]:
+            return
+
+        placeholders = ",".join("?" for _ in self.BULK_DEFERRED_INDEXES)
+        rows = self.conn.execute(
+            f"SELECT name, sql FROM sqlite_master WHERE type='index' AND name IN ({placeholders})",
+            self.BULK_DEFERRED_INDEXES,
+        ).fetchall()
+        self._deferred_indexes = [(r["name"], r["sql"]) for r in rows if r["sql"]]
+        for name, _ in self._deferred_indexes:
+            self.conn.execute(f"DROP INDEX IF EXISTS {name}")
+
+    def end_bulk_import(self) -> None:
+        """Rebuild the indexes dropped by begin_bulk_import() and restore the page cache and mmap sizes."""
+        for name, sql in self._deferred_indexes:
+            _logger.debug("Rebuilding index %s", name)
+            self.conn.execute(sql)
+        self._deferred_indexes = []
+        if self._saved_cache_size is not None:
+            self.conn.execute(f"PRAGMA cache_size={int(self._saved_cache_size)}")
+            self._saved_cache_size = None
+        if self._saved_mmap_size is not None:
+            self.conn.execute(f"PRAGMA mmap_size={int(self._saved_mmap_size)}")
+            self._saved_mmap_size = None
+
     # -------------------------
     # Import repodata sqlite file (on disk)
     # -------------------------
@@ -212,115 +330,86 @@ class DbManager:
         repo_id = int(repo["id"])
 
         attach_alias = f"src_{uuid.uuid4().hex}"
+        # The donor DB is only read: open it read-only and immutable (no journal/locking) and memory-map it.
+        src_uri = f"{src_path.resolve().as_uri()}?mode=ro&immutable=1"
         cur = self.conn.cursor()
         try:
-            cur.execute(f"ATTACH DATABASE ? AS {attach_alias}", (str(src_path),))
+            cur.execute(f"ATTACH DATABASE ? AS {attach_alias}", (src_uri,))
         except sqlite3.DatabaseError as e:
             cur.close()
             raise RuntimeError(f"Failed to attach {src_path}: {e}")
+        try:
+            cur.execute(f"PRAGMA {attach_alias}.mmap_size=1073741824")
+        except sqlite3.DatabaseError:
+            _logger.debug("PRAGMA mmap_size failed for %s", attach_alias)
 
+        self.begin_bulk_import()
         try:
-            mapping: Dict[int, int] = {}
-
-            # copy packages
-            if self._table_exists_in_attached(attach_alias, "packages"):
-                src_rows = list(self.conn.execute(f"SELECT * FROM {attach_alias}.packages"))
-                for src in src_rows:
-                    s = dict(src)
-                    old_key = s.pop("pkgKey", None)
-                    s.pop("repo_id", None)
-                    new_key = self.insert_package(repo_id, s)
-                    if old_key is not None:
-                        mapping[int(old_key)] = int(new_key)
-
-            # helper to copy relation-like tables
-            def _copy_table(table_name: str, columns: List[str]) -> None:
-                if not self._table_exists_in_attached(attach_alias, table_name):
-                    return
-                src_rows = list(self.conn.execute(f"SELECT * FROM {attach_alias}.{table_name}"))
-                data = []
-                for r in src_rows:
-                    rd = dict(r)
-                    old = rd.get("pkgKey")
-                    if old is None:
-                        continue
-                    new = mapping.get(int(old))
-                    if new is None:
-                        continue
-                    values = [rd.get(c) for c in columns] + [new]
-                    data.append(tuple(values))
-                if data:
-                    col_list = ", ".join(columns + ["pkgKey"])
-                    placeholders = ", ".join("?" for _ in (columns + ["pkgKey"]))
-                    with self.conn:
-                        self.conn.executemany(f"INSERT INTO {table_name} ({col_list}) VALUES ({placeholders})", data)
-
-            relation_cols = ["name", "flags", "epoch", "version", "release"]
-            _copy_table("provides", relation_cols)
-            _copy_table("requires", relation_cols + ["pre"])
-            _copy_table("conflicts", relation_cols)
-            _copy_table("obsoletes", relation_cols)
-            _copy_table("suggests", relation_cols)
-            _copy_table("enhances", relation_cols)
-            _copy_table("recommends", relation_cols)
-            _copy_table("supplements", relation_cols)
-
-            # files
-            if self._table_exists_in_attached(attach_alias, "files"):
-                rows = list(self.conn.execute(f"SELECT name, type, pkgKey FROM {attach_alias}.files"))
-                data = []
-                for r in rows:
-                    rd = dict(r)
-                    new = mapping.get(int(rd["pkgKey"]))
-                    if new is None:
-                        continue
-                    data.append((rd["name"], rd["type"], new))
-                if data:
-                    with self.conn:
-                        self.conn.executemany("INSERT INTO files (name, type, pkgKey) VALUES (?, ?, ?)", data)
-
-            # filelist
-            if self._table_exists_in_attached(attach_alias, "filelist"):
-                rows = list(
-                    self.conn.execute(f"SELECT dirname, filenames, filetypes, pkgKey FROM {attach_alias}.filelist")
-                )
-                data = []
-                for r in rows:
-                    rd = dict(r)
-                    new = mapping.get(int(rd["pkgKey"]))
-                    if new is None:
-                        continue
-                    data.append((new, rd.get("dirname"), rd.get("filenames"), rd.get("filetypes")))
-                if data:
-                    with self.conn:
-                        self.conn.executemany(
-                            "INSERT INTO filelist (pkgKey, dirname, filenames, filetypes) VALUES (?, ?, ?, ?)", data
-                        )
-
-            # changelog
-            if self._table_exists_in_attached(attach_alias, "changelog"):
-                rows = list(self.conn.execute(f"SELECT pkgKey, author, date, changelog FROM {attach_alias}.changelog"))
-                data = []
-                for r in rows:
-                    rd = dict(r)
-                    new = mapping.get(int(rd["pkgKey"]))
-                    if new is None:
-                        continue
-                    data.append((new, rd.get("author"), rd.get("date"), rd.get("changelog")))
-                if data:
-                    with self.conn:
-                        self.conn.executemany(
-                            "INSERT INTO changelog (pkgKey, author, date, changelog) VALUES (?, ?, ?, ?)", data
-                        )
+            with self.conn:
+                self._copy_attached(attach_alias, repo_id)
         finally:
             try:
                 cur.execute(f"DETACH DATABASE {attach_alias}")
             except sqlite3.DatabaseError:
                 _logger.debug("Detach failed for %s (ignored)", attach_alias)
             cur.close()
+            self.end_bulk_import()
 
         return repo_id
 
+    def _copy_attached(self, attach_alias: str, repo_id: int) -> None:
+        """Copy every known table of an attached repodata DB. Runs inside the caller's transaction."""
+        mapping: Dict[int, int] = {}
+        # Source rows are streamed from the cursor into executemany(): sqlite copies every bound value,
+        # so holding rows (or interned strings) in Python would only add to peak memory.
+
+        # copy packages
+        if self._table_exists_in_attached(attach_alias, "packages"):
+            for src in self.conn.execute(f"SELECT * FROM {attach_alias}.packages"):
+                s = dict(src)
+                old_key = s.pop("pkgKey", None)
+                s.pop("repo_id", None)
+                new_key = self._insert_package_row(repo_id, s)
+                if old_key is not None:
+                    mapping[int(old_key)] = int(new_key)
+
+        def _mapped_rows(query: str) -> Iterator[Tuple[Any, ...]]:
+            # (values..., new pkgKey) for rows whose pkgKey was imported; pkgKey is the query's last column
+            for r in self.conn.execute(query):
+                old = r[-1]
+                if old is None:
+                    continue
+                new = mapping.get(int(old))
+                if new is not None:
+                    yield tuple(r)[:-1] + (new,)
+
+        # helper to copy relation-like tables
+        def _copy_table(table_name: str, columns: List[str]) -> None:
+            if not self._table_exists_in_attached(attach_alias, table_name):
+                return
+            # columns missing from the donor table are copied as NULL, as before
+            src_cols = {r["name"] for r in self.conn.execute(f"PRAGMA {attach_alias}.table_info({table_name})")}
+            select = ", ".join(c if c in src_cols else "NULL" for c in columns)
+            col_list = ", ".join(columns + ["pkgKey"])
+            placeholders = ", ".join("?" for _ in (columns + ["pkgKey"]))
+            self.conn.executemany(
+                f"INSERT INTO {table_name} ({col_list}) VALUES ({placeholders})",
+                _mapped_rows(f"SELECT {select}, pkgKey FROM {attach_alias}.{table_name}"),
+            )
+
+        relation_cols = ["name", "flags", "epoch", "version", "release"]
+        _copy_table("provides", relation_cols)
+        _copy_table("requires", relation_cols + ["pre"])
+        _copy_table("conflicts", relation_cols)
+        _copy_table("obsoletes", relation_cols)
+        _copy_table("suggests", relation_cols)
+        _copy_table("enhances", relation_cols)
+        _copy_table("recommends", relation_cols)
+        _copy_table("supplements", relation_cols)
+        _copy_table("files", ["name", "type"])
+        _copy_table("filelist", ["dirname", "filenames", "filetypes"])
+        _copy_table("changelog", ["author", "date", "changelog"])
+
     def _table_exists_in_attached(self, attach_alias: str, table: str) -> bool:
         q = f"SELECT name FROM {attach_alias}.sqlite_master WHERE type='table' AND name=?"
         r = self.conn.execute(q, (table,)).fetchone()
@@ -342,6 +431,9 @@ class DbManager:
             return None
         return self.get_repo(int(src_id))
 
+    # Stay below SQLITE_MAX_VARIABLE_NUMBER on older SQLite builds (999).
+    _IN_CHUNK = 900
+
     def provides_map(self, repo_filter: Optional[Sequence[int]] = None) -> Dict[str, Set[int]]:
         """
         Return a mapping: provide_name -> set(pkgKeys)
@@ -364,6 +456,39 @@ class DbManager:
             out.setdefault(r["pkgKey"], []).append(dict(r))
         return out
 
+    def provides_for(self, names: Iterable[str], repo_filter: Optional[Sequence[int]] = None) -> Dict[str, Set[int]]:
+        """
+        provides_map() restricted to the given capability names (chunked IN queries).
+        """
+        names = list(dict.fromkeys(names))
+        # filter repos in SQL so rows from other repos never leave sqlite
+        repo_ids = list(repo_filter) if repo_filter else []
+        repo_sql = f" AND pkg.repo_id IN ({','.join('?' for _ in repo_ids)})" if repo_ids else ""
+        step = max(1, self._IN_CHUNK - len(repo_ids))
+        out: Dict[str, Set[int]] = {}
+        for i in range(0, len(names), step):
+            chunk = names[i : i + step]
+            sql = (
+                "SELECT p.name, p.pkgKey FROM provides p JOIN packages pkg ON p.pkgKey = pkg.pkgKey"
+                f" WHERE p.name IN ({','.join('?' for _ in chunk)}){repo_sql}"
+            )
+            for r in self.conn.execute(sql, chunk + repo_ids):
+                out.setdefault(r["name"], set()).add(r["pkgKey"])
+        return out
+
+    def requires_for(self, pkgKeys: Iterable[int]) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        requires_map() restricted to the given packages (chunked IN queries).
+        """
+        keys = list(dict.fromkeys(pkgKeys))
+        out: Dict[int, List[Dict[str, Any]]] = {}
+        for i in range(0, len(keys), self._IN_CHUNK):
+            chunk = keys[i : i + self._IN_CHUNK]
+            sql = f"SELECT * FROM requires WHERE pkgKey IN ({','.join('?' for _ in chunk)}) ORDER BY rowid"
+            for r in self.conn.execute(sql, chunk):
+                out.setdefault(r["pkgKey"], []).append(dict(r))
+        return out
+
     def files_map(self) -> Dict[int, List[str]]:
         """
         Return a mapping of pkgKey -> list of filenames in that package.
@@ -386,6 +511,24 @@ class DbManager:
             return None
         return dict(r)
 
+    def get_by_keys(
+        self, pkgKeys: Iterable[int], repo_filter: Optional[Sequence[int]] = None
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Batched get_by_key: return {pkgKey: row} for every key found (and not filtered out by repo_filter).
+        """
+        keys = list(dict.fromkeys(pkgKeys))
+        allowed = frozenset(repo_filter) if repo_filter else None
+        out: Dict[int, Dict[str, Any]] = {}
+        for i in range(0, len(keys), self._IN_CHUNK):
+            chunk = keys[i : i + self._IN_CHUNK]
+            q = f"SELECT * FROM packages WHERE pkgKey IN ({','.join('?' for _ in chunk)})"
+            for r in self.conn.execute(q, chunk):
+                if allowed is not None and r["repo_id"] not in allowed:
+                    continue
+                out[int(r["pkgKey"])] = dict(r)
+        return out
+
     def search_packages(
         self,
         pattern: str,
@@ -394,6 +537,95 @@ class DbManager:
     ) -> List[Dict[str, Any]]:
         self._print_repo_info(repo_filter)
 
+        where, params = self._package_filter(pattern, repo_filter, exact)
+        query = "SELECT * FROM packages"
+        if where:
+            query += " WHERE " + " AND ".join(where)
+
+        rows = self.conn.execute(query, tuple(params)).fetchall()
+        return [dict(row) for row in rows]
+
+    # Same order as NEVRA.row_key, newest first; ties go to the first row in table order, as with max()
+    _NEWEST_FIRST = (
+        "name DESC, COALESCE(CAST(epoch AS INTEGER), 0) DESC,"
+        " COALESCE(version, '') COLLATE rpmvercmp DESC, COALESCE(release, '') COLLATE rpmvercmp DESC,"
+        " COALESCE(arch, '') DESC, pkgKey"
+    )
+
+    # Keep a single compound query well below SQLite's variable / compound-select limits.
+    _MAX_QUERY_PARAMS = 900
+    _MAX_COMPOUND_TERMS = 400
+
+    def _union_batches(
+        self, patterns: Sequence[str], repo_filter: Optional[Sequence[int]], exact: bool
+    ) -> Iterator[Tuple[str, List[Any]]]:
+        """
+        Yield (query, params) UNION ALL queries covering `patterns` in batches.
+        Each row carries `_pat`, the index of the pattern that selected it.
+        """
+        parts: List[str] = []
+        params: List[Any] = []
+        for idx, pat in enumerate(patterns):
+            where, p = self._package_filter(pat, repo_filter, exact)
+            if parts and (len(params) + len(p) > self._MAX_QUERY_PARAMS or len(parts) >= self._MAX_COMPOUND_TERMS):
+                yield " UNION ALL ".join(parts), params
+                parts, params = [], []
+            q = f"SELECT *, {idx} AS _pat FROM packages"
+            if where:
+                q += " WHERE " + " AND ".join(where)
+            parts.append(q)
+            params.extend(p)
+        if parts:
+            yield " UNION ALL ".join(parts), params
+
+    def search_packages_many(
+        self,
+        patterns: Sequence[str],
+        repo_filter: Optional[Sequence[int]] = None,
+        exact: bool = False,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        search_packages() for several patterns at once: one UNION ALL query per batch of patterns.
+        Returns {pattern: rows}, each list matching what search_packages(pattern, ...) would return.
+        """
+        self._print_repo_info(repo_filter)
+
+        out: Dict[str, List[Dict[str, Any]]] = {p: [] for p in patterns}
+        uniq = list(out)
+        for query, params in self._union_batches(uniq, repo_filter, exact):
+            for row in self.conn.execute(query, tuple(params)):
+                d = dict(row)
+                out[uniq[d.pop("_pat")]].append(d)
+        return out
+
+    def latest_packages_many(
+        self,
+        patterns: Sequence[str],
+        repo_filter: Optional[Sequence[int]] = None,
+        exact: bool = True,
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Newest package per pattern, i.e. max(search_packages(...), key=NEVRA.row_key), picked by SQLite
+        with one windowed UNION ALL query per batch of patterns. Returns {pattern: newest row, or None if nothing matched}.
+        """
+        self._print_repo_info(repo_filter)
+
+        out: Dict[str, Optional[Dict[str, Any]]] = dict.fromkeys(patterns)
+        uniq = list(out)
+        for query, params in self._union_batches(uniq, repo_filter, exact):
+            ranked = (
+                f"SELECT * FROM (SELECT *, ROW_NUMBER() OVER (PARTITION BY _pat ORDER BY {self._NEWEST_FIRST})"
+                f" AS _rank FROM ({query})) WHERE _rank = 1"
+            )
+            for row in self.conn.execute(ranked, tuple(params)):
+                d = dict(row)
+                del d["_rank"]
+                out[uniq[d.pop("_pat")]] = d
+        return out
+
+    @staticmethod
+    def _package_filter(pattern: str, repo_filter: Optional[Sequence[int]], exact: bool) -> Tuple[List[str], List[Any]]:
+        """WHERE clauses and parameters selecting the packages matched by one search pattern."""
         # Try NEVRA parsing only if not forcing exact name match
         nv = None
         if not exact:
@@ -433,15 +665,11 @@ class DbManager:
             else:
                 # Wildcards + substring search
                 sql_pattern = pattern.replace("*", "%") if "*" in pattern else f"%{pattern}%"
-                where.append("(LOWER(name) LIKE LOWER(?) OR LOWER(summary) LIKE LOWER(?))")
+                # LIKE already folds ASCII case (as LOWER() does); no per-row LOWER() calls needed
+                where.append("(name LIKE ? OR summary LIKE ?)")
                 params.extend([sql_pattern, sql_pattern])
 
-        query = "SELECT * FROM packages"
-        if where:
-            query += " WHERE " + " AND ".join(where)
-
-        rows = self.conn.execute(query, tuple(params)).fetchall()
-        return [dict(row) for row in rows]
+        return where, params
 
     def _print_repo_info(self, repo_ids: Optional[Sequence[int]] = None) -> None:
         # Fetch repository name(s) and last_updated times, print info like:
@@ -32,6 +32,13 @@ class DownloaderType(Enum):
 
 
 class Downloader:
+    # Connection pool sizing: repomd.xml + primary_db (and RPMs) usually come from the same few mirrors;
+    # requests.Session already reuses connections, this keeps enough of them pooled for concurrent workers.
+    POOL_CONNECTIONS = 16
+    POOL_MAXSIZE = 16
+    # Streaming read size: large enough to keep per-chunk Python overhead (write + progress update) negligible.
+    CHUNK_SIZE = 1 << 16
+
     def __init__(self, config: Config) -> None:
         self.config = config
 
@@ -62,7 +69,11 @@ class Downloader:
                 backoff_factor=0.3,
                 status_forcelist=(500, 502, 503, 504),
             )
-            adapter = HTTPAdapter(max_retries=retries)
+            adapter = HTTPAdapter(
+                pool_connections=self.POOL_CONNECTIONS,
+                pool_maxsize=self.POOL_MAXSIZE,
+                max_retries=retries,
+            )
             self.session.mount("http://", adapter)
             self.session.mount("https://", adapter)
         else:
@@ -71,7 +82,8 @@ class Downloader:
     # -------------------------
     # public API
     # -------------------------
-    def download_to_file(self, url: str, output_path: Union[str, Path]) -> None:
+    def download_to_file(self, url: str, output_path: Union[str, Path], progress: bool = True) -> None:
+        """Download `url` to `output_path`; `progress=False` turns off the per-file progress bar."""
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         if output_path.exists():
@@ -79,7 +91,7 @@ class Downloader:
             return
 
         if self.backend == DownloaderType.PYTHON:
-            self._download_python_to_file(url, output_path)
+            self._download_python_to_file(url, output_path, progress)
         else:
             self._download_powershell_to_file(url, output_path)
 
@@ -101,7 +113,7 @@ class Downloader:
     # -------------------------
     # python backend
     # -------------------------
-    def _download_python_to_file(self, url: str, output_path: Path) -> None:
+    def _download_python_to_file(self, url: str, output_path: Path, progress: bool = True) -> None:
         if not self.session:
             raise RuntimeError("Python downloader not initialized")
 
@@ -114,9 +126,9 @@ class Downloader:
                 unit="iB",
                 unit_scale=True,
                 desc=output_path.name,
-                disable=is_dumb_terminal(),
+                disable=not progress or is_dumb_terminal(),
             ) as bar:
-                for chunk in resp.iter_content(chunk_size=8192):
+                for chunk in resp.iter_content(chunk_size=self.CHUNK_SIZE):
                     if chunk:
                         fh.write(chunk)
                         bar.update(len(chunk))
@@ -129,7 +141,7 @@ class Downloader:
 
         with self.session.get(url, stream=True, timeout=60) as resp:
             resp.raise_for_status()
-            return b"".join(chunk for chunk in resp.iter_content(8192) if chunk)
+            return b"".join(chunk for chunk in resp.iter_content(self.CHUNK_SIZE) if chunk)
 
     # -------------------------
     # powershell backend
@@ -3,16 +3,15 @@ from __future__ import annotations
 
 import bz2
 import gzip
-import io
 import logging
 import lzma
 import os
 import re
 import tempfile
+import threading
 import xml.etree.ElementTree as ET
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional
 from urllib.parse import urljoin
 
 from .config import Config
@@ -70,6 +69,8 @@ class MetadataManager:
         self.db = db_manager
         self.downloader = downloader
         self.max_workers = max_workers
+        # Repos may be synced from several threads: downloads overlap, imports into the shared DB do not
+        self._db_lock = threading.Lock()
 
     # --------------------------------------------------------
     # Main entry: sync one repo
@@ -102,10 +103,11 @@ class MetadataManager:
                 raise RuntimeError("Failed to prepare sqlite metadata")
             _logger.info("Using sqlite metadata: %s", sqlite_temp)
             # Import into unified DB
-            _logger.info("Wiping existing packages for repo id %s", repo_id)
-            self.db.wipe_repo_packages(repo_id)
-            self.db.import_repodb(sqlite_temp, repo_row["name"])
-            self.db.update_repo_timestamp(repo_id, datetime.utcnow().isoformat())
+            with self._db_lock:
+                _logger.info("Wiping existing packages for repo id %s", repo_id)
+                self.db.wipe_repo_packages(repo_id)
+                self.db.import_repodb(sqlite_temp, repo_row["name"])
+                self.db.update_repo_timestamp(repo_id, datetime.utcnow().isoformat())
 
         except Exception as e:
             _logger.error(f"Failed to sync repo '{repo_row['name']}'")
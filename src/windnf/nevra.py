@@ -2,7 +2,7 @@
 import functools
 import re
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Optional, Tuple
 
 # Regex supports names with dots, dashes, underscores, plus, digits.
 # Accepts optional epoch in the form -E:version-release.arch
@@ -22,6 +22,63 @@ NEVRA_RE = re.compile(
     re.VERBOSE,
 )
 
+# Splits a version/release string into alternating numeric / non-numeric chunks.
+_SPLIT_RE = re.compile(r"[0-9]+|[^0-9]+")
+
+# Character classes of NEVRA_RE, for the split-based fast path in NEVRA.parse
+_FIELD_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789._+-")
+_ARCH_CHARS = _FIELD_CHARS - {"-"}
+_DIGITS = frozenset("0123456789")
+
+
+def _split_nevra(s: str) -> Optional[Tuple[str, Optional[str], str, str, str]]:
+    """
+    Split name-[epoch:]version-release.arch on the last '.' and the last two '-'.
+    Returns None when the string does not fit; NEVRA.parse then falls back to NEVRA_RE.
+    """
+    i = s.rfind(".")
+    if i <= 0:
+        return None
+    j = s.rfind("-", 0, i)
+    k = s.rfind("-", 0, j) if j > 0 else -1
+    if k <= 0:
+        return None
+    name, ver_field, release, arch = s[:k], s[k + 1 : j], s[j + 1 : i], s[i + 1 :]
+    epoch, sep, version = ver_field.rpartition(":")
+    if not sep:
+        epoch = None
+    elif not epoch or not _DIGITS.issuperset(epoch):
+        return None
+    if not (name and version and release and arch):
+        return None
+    if not (
+        _FIELD_CHARS.issuperset(name)
+        and _FIELD_CHARS.issuperset(version)
+        and _FIELD_CHARS.issuperset(release)
+        and _ARCH_CHARS.issuperset(arch)
+    ):
+        return None
+    return name, epoch, version, release, arch
+
+
+@functools.lru_cache(maxsize=8192)
+def _vsplit(s: Optional[str]) -> Tuple[Tuple[int, int, str], ...]:
+    """
+    Ordering key for a version/release string (see rpmvercmp), compared as plain tuples.
+
+    The string is split into numeric / non-numeric chunks. Numeric chunks sort by
+    value; non-numeric chunks sort as strings and fall before/after numeric ones
+    depending on their first character (as a string comparison of the two chunks
+    would). If all shared chunks are equal, the longer sequence wins.
+    """
+    out = []
+    for part in _SPLIT_RE.findall(s or ""):
+        if part.isdigit():
+            out.append((1, int(part), ""))
+        else:
+            out.append((0 if part[0] < "0" else 2, 0, part))
+    return tuple(out)
+
 
 def rpmvercmp(a: str, b: str) -> int:
     """
@@ -33,31 +90,8 @@ def rpmvercmp(a: str, b: str) -> int:
     This is not a perfect reimplementation of rpmvercmp but is
     sufficient for sorting versions in common metadata.
     """
-
-    def split_parts(s: str):
-        # split into numeric and non-numeric chunks
-        return re.findall(r"[0-9]+|[^0-9]+", s or "")
-
-    def cmp_item(x, y):
-        # compare numeric if both digits, else lexicographic
-        if isinstance(x, int) and isinstance(y, int):
-            return (x > y) - (x < y)
-        return (str(x) > str(y)) - (str(x) < str(y))
-
-    pa = split_parts(a or "")
-    pb = split_parts(b or "")
-
-    for xa, xb in zip(pa, pb):
-        if xa.isdigit() and xb.isdigit():
-            na, nb = int(xa), int(xb)
-            if na != nb:
-                return (na > nb) - (na < nb)
-        else:
-            if xa != xb:
-                return (xa > xb) - (xa < xb)
-
-    # if all zipped parts equal, longer sequence wins
-    return (len(pa) > len(pb)) - (len(pa) < len(pb))
+    ka, kb = _vsplit(a), _vsplit(b)
+    return (ka > kb) - (ka < kb)
 
 
 @functools.total_ordering
@@ -97,19 +131,21 @@ class NEVRA:
             raise ValueError("NEVRA.parse expects a string")
 
         s = s.strip()
-        m = NEVRA_RE.match(s)
-        if not m:
-            raise ValueError(f"Invalid NEVRA string: {s}")
-        d = m.groupdict()
-        arch = d.get("arch")
-        src = arch in ("src", "nosrc")
+        parts = _split_nevra(s)
+        if parts is None:
+            m = NEVRA_RE.match(s)
+            if not m:
+                raise ValueError(f"Invalid NEVRA string: {s}")
+            d = m.groupdict()
+            parts = (d.get("name"), d.get("epoch"), d.get("version"), d.get("release"), d.get("arch"))
+        name, epoch, version, release, arch = parts
         return NEVRA(
-            name=d.get("name"),
-            epoch=d.get("epoch"),
-            version=d.get("version"),
-            release=d.get("release"),
+            name=name,
+            epoch=epoch,
+            version=version,
+            release=release,
             arch=arch,
-            src=src,
+            src=arch in ("src", "nosrc"),
         )
 
     @staticmethod
@@ -131,6 +167,20 @@ class NEVRA:
             src=(row.get("arch") in ("src", "nosrc")),
         )
 
+    @staticmethod
+    def row_key(row: Dict[str, Any]) -> Tuple:
+        """
+        Sort key for a DB row, ordered like NEVRA.__lt__ but without building a NEVRA.
+        Use as `max(rows, key=NEVRA.row_key)` to pick the newest row.
+        """
+        return (
+            row["name"],
+            int(row.get("epoch") or 0),
+            _vsplit(row.get("version")),
+            _vsplit(row.get("release")),
+            row.get("arch") or "",
+        )
+
     @staticmethod
     def from_rpm_filename(filename: str) -> "NEVRA":
         """
@@ -175,15 +225,27 @@ class NEVRA:
     # -----
     # Ordering / comparison
     # -----
-    def _cmp_tuple(self) -> Tuple:
+    @functools.cached_property
+    def _cmp_key(self) -> Tuple:
         epoch_val = int(self.epoch) if (self.epoch and self.epoch.isdigit()) else 0
         return (self.name, epoch_val, self.version or "", self.release or "", self.arch or "")
 
+    def _cmp_tuple(self) -> Tuple:
+        return self._cmp_key
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, NEVRA):
             return False
         return self._cmp_tuple() == other._cmp_tuple()
 
+    def __hash__(self) -> int:
+        # consistent with __eq__: metadata fields (pkgId, repo_id, src) are not part of the key
+        return self._hash
+
+    @functools.cached_property
+    def _hash(self) -> int:
+        return hash(self._cmp_key)
+
     def __lt__(self, other: "NEVRA") -> bool:
         if not isinstance(other, NEVRA):
             return NotImplemented
@@ -198,15 +260,15 @@ class NEVRA:
         if e1 != e2:
             return e1 < e2
 
-        # Version compare with rpmvercmp
-        c = rpmvercmp(self.version or "", other.version or "")
-        if c != 0:
-            return c < 0
+        # Version compare (rpmvercmp order, via cached split keys)
+        v1, v2 = _vsplit(self.version), _vsplit(other.version)
+        if v1 != v2:
+            return v1 < v2
 
-        # Release compare with rpmvercmp
-        c = rpmvercmp(self.release or "", other.release or "")
-        if c != 0:
-            return c < 0
+        # Release compare (rpmvercmp order, via cached split keys)
+        r1, r2 = _vsplit(self.release), _vsplit(other.release)
+        if r1 != r2:
+            return r1 < r2
 
         # Arch compare lexicographic
         return (self.arch or "") < (other.arch or "")
@@ -233,13 +295,23 @@ class NEVRA:
         """
         if row is None:
             return False
-        return (
-            row.get("name") == self.name
-            and str(row.get("epoch") or "0") == str(self.epoch or "0")
-            and row.get("version") == self.version
-            and row.get("release") == self.release
-            and row.get("arch") == self.arch
-        )
+        return self._row_matcher(row)
+
+    @functools.cached_property
+    def _row_matcher(self) -> Callable[[Dict[str, Any]], bool]:
+        # Specialized once per NEVRA: the fields (and the normalized epoch) live in closure cells.
+        name, epoch, version, release, arch = self.name, str(self.epoch or "0"), self.version, self.release, self.arch
+
+        def _match(row: Dict[str, Any]) -> bool:
+            return (
+                row.get("name") == name
+                and str(row.get("epoch") or "0") == epoch
+                and row.get("version") == version
+                and row.get("release") == release
+                and row.get("arch") == arch
+            )
+
+        return _match
 
     def is_source(self) -> bool:
         return self.src or (self.arch in ("src", "nosrc"))
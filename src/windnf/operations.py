@@ -2,21 +2,163 @@
 from __future__ import annotations
 
 import fnmatch
+import functools
 import logging
+import os
 import re
 import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Set
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set
+
+from tqdm import tqdm
+from tqdm.contrib.logging import logging_redirect_tqdm
 
 from .config import Config
 from .db_manager import DbManager
-from .downloader import Downloader
-from .logger import Colors
+from .downloader import Downloader, DownloaderType
+from .logger import Colors, is_dumb_terminal
 from .metadata_manager import MetadataManager
 from .nevra import NEVRA
 
 _logger = logging.getLogger(__name__)
 
+# Concurrent RPM transfers in download()
+_DOWNLOAD_WORKERS = 4
+
+
+@functools.lru_cache(maxsize=1024)
+def _literal_regex(pattern: str) -> "re.Pattern[str]":
+    """Compiled case-insensitive regex matching `pattern` literally (cached across rows)."""
+    return re.compile(re.escape(pattern), re.IGNORECASE)
+
+
+# Highlight sequences, fixed at import: logger blanks Colors once, when it is imported, on a dumb terminal.
+_HL_PREFIX = Colors.FG_BRIGHT_RED + Colors.BOLD
+_HL_SUFFIX = Colors.RESET
+# re.sub() template: the match is expanded in C instead of a per-match Python callback
+_HL_REPLACEMENT = _HL_PREFIX.replace("\\", "\\\\") + r"\g<0>" + _HL_SUFFIX.replace("\\", "\\\\")
+
+
+def _highlight(text: str, pattern: str) -> str:
+    """Wrap every case-insensitive occurrence of `pattern` in `text` with highlight colors."""
+    if not pattern:
+        return text
+    lo, plo = text.lower(), pattern.lower()
+    if len(lo) != len(text) or len(plo) != len(pattern):
+        # lowercasing changed lengths (rare non-ASCII cases): offsets would not line up
+        return _literal_regex(pattern).sub(_HL_REPLACEMENT, text)
+    out: List[str] = []
+    i, n = 0, len(plo)
+    while (j := lo.find(plo, i)) != -1:
+        out.append(text[i:j])
+        out.append(_HL_PREFIX)
+        out.append(text[j : j + n])
+        out.append(_HL_SUFFIX)
+        i = j + n
+    out.append(text[i:])
+    return "".join(out)
+
+
+# Package names repeat across versions/arches of the same package: highlight each name once per pattern.
+_highlight_name = functools.lru_cache(maxsize=4096)(_highlight)
+
+
+def _pattern_source(pat_lc: str) -> str:
+    """Regex source with search() semantics: full glob match if the pattern has '*', substring otherwise."""
+    if "*" in pat_lc:
+        return fnmatch.translate(pat_lc)
+    return f"(?s:.*?{re.escape(pat_lc)})"
+
+
+def _multi_matcher(pats_lc: Sequence[str]) -> Callable[[str], List[bool]]:
+    """
+    Return fn(text) -> [hit for each pattern].
+
+    Several patterns are folded into a single regex of optional zero-width lookaheads,
+    each recording its hit in a named group, so a row is scanned with one match() call
+    whatever the number of patterns.
+    """
+    if len(pats_lc) == 1:
+        pat_lc = pats_lc[0]
+        if "*" not in pat_lc:
+            return lambda text: [pat_lc in text]
+        glob_match = re.compile(fnmatch.translate(pat_lc)).match
+        return lambda text: [glob_match(text) is not None]
+
+    try:
+        union = re.compile("".join(f"(?:(?={_pattern_source(p)})(?P<_m{i}>))?" for i, p in enumerate(pats_lc)))
+    except re.error:
+        # e.g. fnmatch.translate() group names clashing between patterns on older Pythons
+        matchers = [re.compile(_pattern_source(p)).match for p in pats_lc]
+        return lambda text: [m(text) is not None for m in matchers]
+
+    slots = [union.groupindex[f"_m{i}"] - 1 for i in range(len(pats_lc))]
+    union_match = union.match
+
+    def hits(text: str) -> List[bool]:
+        groups = union_match(text).groups()
+        return [groups[s] is not None for s in slots]
+
+    return hits
+
+
+def _dependency_order(
+    roots: Iterable[int], dep_map: Dict[int, List[Dict[str, Any]]], resolved_keys: Set[int]
+) -> List[int]:
+    """
+    Resolved pkgKeys in dependency order (each package after the packages it depends on): iterative
+    post-order DFS from the requested packages over dep_map. Cycles are broken where they close.
+    """
+    order: List[int] = []
+    done: Set[int] = set()
+    active: Set[int] = set()
+    for root in roots:
+        if root in done:
+            continue
+        active.add(root)
+        stack = [(root, iter(dep_map.get(root, ())))]
+        while stack:
+            key, deps = stack[-1]
+            for dep in deps:
+                dep_key = dep["pkgKey"]
+                if dep_key in done or dep_key not in resolved_keys:
+                    continue
+                if dep_key in active:
+                    _logger.debug("Dependency cycle: %s -> %s", key, dep_key)
+                    continue
+                active.add(dep_key)
+                stack.append((dep_key, iter(dep_map.get(dep_key, ()))))
+                break
+            else:
+                stack.pop()
+                active.discard(key)
+                done.add(key)
+                order.append(key)
+    # not reachable through dep_map (should not happen): keep them rather than drop them
+    order.extend(k for k in resolved_keys if k not in done)
+    return order
+
+
+def _stage_file(src: Path, dst: Path, link: bool = False) -> str:
+    """
+    Put a downloaded file at `dst`: a regular copy (shutil uses sendfile / large-buffer copies where
+    available), or with `link` a hard link when possible (same volume, no data copied).
+    Returns "present" if `dst` already is `src`, "linked" if this call linked it, else "copied".
+    """
+    if dst.exists() and os.path.samefile(src, dst):
+        return "present"
+    if link:
+        try:
+            os.link(src, dst)
+            return "linked"
+        except OSError:
+            # other volume, unsupported filesystem, or dst already exists: overwrite like before
+            pass
+    shutil.copy2(src, dst)
+    return "copied"
+
 
 class Operations:
     def __init__(self, config: Config):
@@ -24,6 +166,8 @@ class Operations:
         self.db = DbManager(config)
         self.downloader = Downloader(config)
         self.metadata = MetadataManager(config, self.db, self.downloader, max_workers=4)
+        # Terminal width is looked up once per command, not per printed delimiter
+        self._term_w = shutil.get_terminal_size((80, 20)).columns
         _logger.debug(
             "Operations initialized with DB=%s, downloader=%s",
             config.db_path,
@@ -32,29 +176,33 @@ class Operations:
 
     # --- Utilities ---
     def highlight_match(self, text: str, pattern: str) -> str:
-        if not pattern:
-            return text
-        regex = re.compile(re.escape(pattern), re.IGNORECASE)
-        return regex.sub(lambda m: f"{Colors.FG_BRIGHT_RED}{Colors.BOLD}{m.group(0)}{Colors.RESET}", text)
+        return _highlight(text, pattern)
 
     def highlight_name_in_nevra(self, nevra_str: str, name: str, pattern: Optional[str]) -> str:
         if not pattern or not name:
             return nevra_str
-        highlighted_name = self.highlight_match(name, pattern)
-        escaped_name = re.escape(name)
-        return re.sub(escaped_name, highlighted_name, nevra_str, count=1, flags=re.IGNORECASE)
+        highlighted_name = _highlight_name(name, pattern)
+        # NEVRA strings start with the name (same row, same case): splice instead of searching for it
+        n = len(name)
+        if nevra_str.startswith(name) or nevra_str[:n].lower() == name.lower():
+            return highlighted_name + nevra_str[n:]
+        i = nevra_str.find(name)
+        if i != -1:
+            return nevra_str[:i] + highlighted_name + nevra_str[i + n :]
+        return _literal_regex(name).sub(highlighted_name, nevra_str, count=1)
 
     def print_delimiter(self, title: str = "") -> None:
-        width = shutil.get_terminal_size((80, 20)).columns
+        width = self._term_w
         line = f" {title} ".center(width, "=") if title else "=" * width
         print(line)
 
     def _resolve_repo_names_to_ids(self, repo_names: Optional[Sequence[str]]) -> Optional[List[int]]:
         if not repo_names:
             return None
+        repos = self.db.get_repos(repo_names)
         out: List[int] = []
         for name in repo_names:
-            repo = self.db.get_repo(name)
+            repo = repos.get(name)
             if not repo:
                 _logger.error("Repository not found: %s", name)
                 raise ValueError(f"Repository not found: {name}")
@@ -96,7 +244,7 @@ class Operations:
         if not rows:
             _logger.info("No repositories configured.")
             return
-        term_w = shutil.get_terminal_size((80, 20)).columns
+        term_w = self._term_w
         spacing = 2
         id_w, type_w, last_w = 4, 6, 30
         name_w, src_w = 15, 15
@@ -115,74 +263,103 @@ class Operations:
             url_w = max(10, int(url_w * shrink_ratio))
 
         def trunc(s, w):
-            return s if s and len(s) <= w else (s[: w - 1] + "…") if s else "-"
+            if not s:
+                return "-"
+            return s if len(s) <= w else s[: w - 1] + "…"
+
+        spacer = " " * spacing
 
         header = (
-            f"{'ID':<{id_w}}{' '*spacing}{'Name':<{name_w}}{' '*spacing}"
-            f"{'Base URL':<{url_w}}{' '*spacing}{'Type':<{type_w}}{' '*spacing}"
-            f"{'Src':<{src_w}}{' '*spacing}{'Last Synced':<{last_w}}"
+            f"{'ID':<{id_w}}{spacer}{'Name':<{name_w}}{spacer}"
+            f"{'Base URL':<{url_w}}{spacer}{'Type':<{type_w}}{spacer}"
+            f"{'Src':<{src_w}}{spacer}{'Last Synced':<{last_w}}"
         )
-        print(header)
-        print("-" * term_w)
+        lines = [header, "-" * term_w]
+        src_repos = self.db.get_repos_by_ids(r["source_repo_id"] for r in rows if r.get("source_repo_id"))
         for r in rows:
             src_id = r.get("source_repo_id")
             src_name = "-"
             if src_id:
-                src_repo = self.db.get_repo(src_id)
+                src_repo = src_repos.get(int(src_id))
                 src_name = src_repo["name"] if src_repo else "-"
             last_synced = r.get("last_updated") or "-"
             name, url = r["name"], r["base_url"]
-            print(
-                f"{trunc(str(r['id']), id_w):<{id_w}}{' '*spacing}{trunc(name, name_w):<{name_w}}{' '*spacing}"
-                f"{trunc(url, url_w):<{url_w}}{' '*spacing}{trunc(r['type'], type_w):<{type_w}}{' '*spacing}"
-                f"{trunc(src_name, src_w):<{src_w}}{' '*spacing}{trunc(last_synced, last_w):<{last_w}}"
+            lines.append(
+                f"{trunc(str(r['id']), id_w):<{id_w}}{spacer}{trunc(name, name_w):<{name_w}}{spacer}"
+                f"{trunc(url, url_w):<{url_w}}{spacer}{trunc(r['type'], type_w):<{type_w}}{spacer}"
+                f"{trunc(src_name, src_w):<{src_w}}{spacer}{trunc(last_synced, last_w):<{last_w}}"
             )
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def reposync(self, names: List[str], all_: bool) -> None:
-        repos = self.db.list_repos() if all_ else [r for n in names if (r := self.db.get_repo(n)) is not None]
+        if all_:
+            repos = self.db.list_repos()
+        else:
+            found = self.db.get_repos(names)
+            # a repo named twice (or by both name and id) is synced once, not downloaded and imported twice
+            repos = list({found[n]["id"]: found[n] for n in names if n in found}.values())
 
         if not repos:
             _logger.info("No repositories to sync.")
             return
 
-        for r in repos:
-            name = r["name"]
-            _logger.info("Starting sync for repository '%s'", name)
-            try:
-                self.metadata.sync_repo(r)
-            except RuntimeError as e:
-                _logger.error("Failed to sync repository '%s': %s", name, e)
-            else:
-                _logger.info("Successfully synced repository '%s'", name)
+        # Metadata downloads are network-bound: fetch several repos at once (imports are serialized
+        # by MetadataManager). The PowerShell backend draws a console spinner, so it stays sequential.
+        workers = self.metadata.max_workers if self.downloader.backend == DownloaderType.PYTHON else 1
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(repos)))) as ex:
+            futures = {}
+            for r in repos:
+                _logger.info("Starting sync for repository '%s'", r["name"])
+                futures[ex.submit(self.metadata.sync_repo, r)] = r["name"]
+            for fut in as_completed(futures):
+                name = futures[fut]
+                try:
+                    fut.result()
+                except RuntimeError as e:
+                    _logger.error("Failed to sync repository '%s': %s", name, e)
+                else:
+                    _logger.info("Successfully synced repository '%s'", name)
 
     def repodel(self, names: Optional[List[str]] = None, all_: bool = False, force: bool = False) -> None:
         names = names or []
-        repos_to_delete = self.db.list_repos() if all_ else [self.db.get_repo(n) for n in names if self.db.get_repo(n)]
+        if all_:
+            repos_to_delete = self.db.list_repos()
+        else:
+            found = self.db.get_repos(names)
+            repos_to_delete = [found[n] for n in names if n in found]
 
         if not repos_to_delete:
             _logger.info("No repositories found for deletion.")
             return
 
+        # Ask first, then delete everything confirmed in one transaction (one commit, not one per repo)
+        confirmed: List[Dict[str, Any]] = []
         for repo in repos_to_delete:
             if repo is None:
                 continue
             name = repo["name"]
             proceed = force or input(f"Delete repository {name}? [y/N]: ").lower() == "y"
             if proceed:
-                self.db.delete_repo(repo["id"])
-                _logger.info("Deleted repository '%s'", name)
+                confirmed.append(repo)
             else:
                 _logger.info("Skipped deletion of repository '%s'", name)
 
+        if confirmed:
+            self.db.delete_repos(repo["id"] for repo in confirmed)
+            for repo in confirmed:
+                _logger.info("Deleted repository '%s'", repo["name"])
+
     # --- Package Search / Info ---
     def search(self, patterns: List[str], repo: Optional[List[str]] = None, showduplicates: bool = False) -> None:
         repo_ids = self._resolve_repo_names_to_ids(repo) if repo else None
         all_results: List[Dict[str, Any]] = []
 
+        found = self.db.search_packages_many(patterns, repo_filter=repo_ids, exact=False)
         for pat in patterns:
-            results = self.db.search_packages(pat, repo_filter=repo_ids, exact=False)
+            results = found[pat]
             if results:
-                all_results.extend(results)
+                # table order, whichever index plan SQLite chose (prefix globs come back in NOCASE index order)
+                all_results.extend(sorted(results, key=lambda r: r["pkgKey"]))
             else:
                 _logger.info("No packages found for pattern: %s", pat)
 
@@ -192,62 +369,56 @@ class Operations:
 
         # Filter duplicates if needed
         if not showduplicates:
-            latest_per_name: Dict[str, Dict[str, Any]] = {}
+            # name -> (sort key, row): each row's key is computed exactly once
+            latest_per_name: Dict[str, tuple] = {}
             for r in all_results:
-                n = r["name"]
+                k = NEVRA.row_key(r)
+                n = k[0]
                 cur = latest_per_name.get(n)
-                if not cur or NEVRA.from_row(r) > NEVRA.from_row(cur):
-                    latest_per_name[n] = r
-            results = list(latest_per_name.values())
+                if cur is None or k > cur[0]:
+                    latest_per_name[n] = (k, r)
+            results = [r for _, r in latest_per_name.values()]
         else:
             results = all_results
 
-        # Precompute lowercase & NEVRA for highlights
-        for r in results:
-            r["_name_lc"] = r.get("name", "").lower()
-            r["_summary_lc"] = r.get("summary", "").lower()
-            r["_nevra"] = NEVRA.from_row(r)
-
-        for pat in patterns:
-            name_summary, summary_only, name_only = [], [], []
-            pat_lc = pat.lower()
-            is_wildcard = "*" in pat
-
-            for r in results:
-                name, summary = r.get("name", ""), r.get("summary", "")
-                name_lc, summary_lc = r["_name_lc"], r["_summary_lc"]
-
-                match_name = fnmatch.fnmatchcase(name_lc, pat_lc) if is_wildcard else pat_lc in name_lc
-                match_summary = fnmatch.fnmatchcase(summary_lc, pat_lc) if is_wildcard else pat_lc in summary_lc
-                if not (match_name or match_summary):
+        # Column-wise views of the results, built once and shared by every pattern.
+        # Lowercased with str.lower() like the patterns: SQL LOWER() only folds ASCII.
+        names = [r.get("name", "") for r in results]
+        summaries = [r.get("summary", "") for r in results]
+        names_lc = [name.lower() for name in names]
+        summaries_lc = [(summary or "").lower() for summary in summaries]
+        nevra_strs = [str(NEVRA.from_row(r)) for r in results]
+
+        # All patterns are evaluated together: one matcher call per row and field
+        match_all = _multi_matcher([pat.lower() for pat in patterns])
+        wildcard = ["*" in pat for pat in patterns]
+        # per pattern, indexed by (match_name << 1) | match_summary: [unused, summary only, name only, both]
+        buckets: List[List[List[str]]] = [[[], [], [], []] for _ in patterns]
+        highlight_nevra = self.highlight_name_in_nevra
+
+        for name, summary, name_lc, summary_lc, nevra_str in zip(names, summaries, names_lc, summaries_lc, nevra_strs):
+            name_hits = match_all(name_lc)
+            summary_hits = match_all(summary_lc)
+            # every row is classified against every pattern (fnmatch semantics), not just the query that found it
+            for i, pat in enumerate(patterns):
+                bits = (name_hits[i] << 1) | summary_hits[i]
+                if not bits:
                     continue
-
-                nevra_str = str(r["_nevra"])
-                disp_summary = self.highlight_match(summary, pat) if match_summary and not is_wildcard else summary
-                nevra_disp = (
-                    self.highlight_name_in_nevra(nevra_str, name, pat) if match_name and not is_wildcard else nevra_str
-                )
-                line = f"{nevra_disp} : {disp_summary}"
-
-                if match_name and match_summary:
-                    name_summary.append(line)
-                elif match_summary:
-                    summary_only.append(line)
-                elif match_name:
-                    name_only.append(line)
-
-            if name_summary:
-                self.print_delimiter(f"Name & Summary Matched: {pat}")
-                for line in name_summary:
-                    print(line)
-            if summary_only:
-                self.print_delimiter(f"Summary Matched: {pat}")
-                for line in summary_only:
-                    print(line)
-            if name_only:
-                self.print_delimiter(f"Name Matched: {pat}")
-                for line in name_only:
-                    print(line)
+                if wildcard[i]:
+                    line = f"{nevra_str} : {summary}"
+                else:
+                    disp_summary = _highlight(summary, pat) if bits & 1 else summary
+                    nevra_disp = highlight_nevra(nevra_str, name, pat) if bits & 2 else nevra_str
+                    line = f"{nevra_disp} : {disp_summary}"
+                buckets[i][bits].append(line)
+
+        for pat, pat_buckets in zip(patterns, buckets):
+            for bits, title in ((3, "Name & Summary Matched"), (1, "Summary Matched"), (2, "Name Matched")):
+                lines = pat_buckets[bits]
+                if lines:
+                    self.print_delimiter(f"{title}: {pat}")
+                    # one write per bucket instead of one print() per line
+                    sys.stdout.write("\n".join(lines) + "\n")
 
     def info(
         self,
@@ -259,14 +430,21 @@ class Operations:
         verbose: bool = False,
     ) -> None:
         repo_ids = self._resolve_repo_names_to_ids(repo) if repo else None
+        repo_names: Dict[int, str] = {}
+        best_rows = self.db.latest_packages_many(packages, repo_filter=repo_ids)
         for pat in packages:
-            rows = self.db.search_packages(pat, repo_filter=repo_ids, exact=True)
-            if not rows:
+            best_row = best_rows[pat]
+            if best_row is None:
                 _logger.info("No packages match pattern: %s", pat)
                 continue
-            best_row = max(rows, key=lambda row: NEVRA.from_row(row))
             nevra = NEVRA.from_row(best_row)
-            repo_name = self.db.get_repo(best_row["repo_id"])["name"] if best_row.get("repo_id") else "<unknown>"
+            if best_row.get("repo_id"):
+                repo_id = int(best_row["repo_id"])
+                if repo_id not in repo_names:
+                    repo_names[repo_id] = self.db.get_repo(repo_id)["name"]
+                repo_name = repo_names[repo_id]
+            else:
+                repo_name = "<unknown>"
             self.print_delimiter(f"Package Information for {pat}")
             print(f"Package: {nevra}")
             print(f" Repo: {repo_name}")
@@ -283,33 +461,50 @@ class Operations:
         weakdeps: bool = False,
         recursive: Optional[int] = None,
         arch: Optional[str] = None,
+        leaf_requires: bool = False,
     ) -> Dict[str, Any]:
-        """Internal method: resolves package dependencies. Does NOT print anything."""
+        """
+        Internal method: resolves package dependencies. Does NOT print anything.
+        With `leaf_requires`, requires_map also covers resolved packages that were not expanded.
+        """
         repo_ids = self._resolve_repo_names_to_ids(repo) if repo else None
-        to_resolve: List[Dict[str, Any]] = []
+        # pkgKey -> row: overlapping patterns ("curl curl*") select the same package only once
+        to_resolve: Dict[int, Dict[str, Any]] = {}
 
+        best_rows = self.db.latest_packages_many(packages, repo_filter=repo_ids)
         for pat in packages:
-            rows = self.db.search_packages(pat, repo_filter=repo_ids, exact=True)
-            if not rows:
+            best_row = best_rows[pat]
+            if best_row is None:
                 continue
-            best_row = max(rows, key=lambda r: NEVRA.from_row(r))
-            to_resolve.append(best_row)
+            # keep the last occurrence's position: the stack is popped from the end
+            to_resolve.pop(best_row["pkgKey"], None)
+            to_resolve[best_row["pkgKey"]] = best_row
 
         if not to_resolve:
-            return {"resolved_rows": [], "dep_map": {}, "unsatisfied": set()}
+            return {"resolved_rows": [], "dep_map": {}, "satisfied": {}, "unsatisfied": set(), "requires_map": {}}
 
-        provides_map = self.db.provides_map(repo_filter=repo_ids)
-        requires_map = self.db.requires_map()
+        # Loaded on demand for the packages actually expanded, instead of the whole provides/requires tables
+        provides_map: Dict[str, Set[int]] = {}
+        requires_map: Dict[int, List[Dict[str, Any]]] = {}
+
+        def load_requires(keys: Sequence[int]) -> None:
+            fetched = self.db.requires_for(keys)
+            for k in keys:
+                requires_map[k] = fetched.get(k, [])
 
         resolved_keys: Set[int] = set()
         dep_map: Dict[int, List[Dict[str, Any]]] = {}
+        # pkgKey -> names of the packages picked to satisfy its requirements (built alongside dep_map)
+        satisfied: Dict[int, Set[str]] = {}
         unsatisfied_dependencies: Set[str] = set()
 
-        # stack entries: (pkg_row, remaining_depth)
-        stack: List[tuple[Dict[str, Any], Optional[int]]] = []
+        # pkgKey -> package row (None when filtered out by repo), fetched in one query per expanded package
+        rows_by_key: Dict[int, Optional[Dict[str, Any]]] = dict(to_resolve)
 
-        for row in to_resolve:
-            stack.append((row, recursive))
+        # stack entries: (pkg_row, remaining_depth)
+        stack: List[tuple[Dict[str, Any], Optional[int]]] = [(row, recursive) for row in to_resolve.values()]
+        # keys pending on the stack with unlimited depth: pushing them again could not expand anything more
+        queued: Set[int] = set(to_resolve) if recursive is not None and recursive < 0 else set()
 
         while stack:
             pkg_row, depth = stack.pop()
@@ -320,12 +515,27 @@ class Operations:
             resolved_keys.add(pkgKey)
 
             dep_map[pkgKey] = []
+            satisfied[pkgKey] = set()
 
             # depth == 0 → do not expand deps
             if depth == 0:
                 continue
 
-            reqs = requires_map.get(pkgKey, [])
+            if pkgKey not in requires_map:
+                load_requires([pkgKey])
+            reqs = requires_map[pkgKey]
+
+            new_names = {r["name"] for r in reqs if r["name"] not in provides_map}
+            if new_names:
+                fetched_provides = self.db.provides_for(new_names, repo_filter=repo_ids)
+                for req_name in new_names:
+                    provides_map[req_name] = fetched_provides.get(req_name, set())
+
+            missing = {pKey for r in reqs for pKey in provides_map.get(r["name"], ()) if pKey not in rows_by_key}
+            if missing:
+                fetched = self.db.get_by_keys(missing, repo_filter=repo_ids)
+                for pKey in missing:
+                    rows_by_key[pKey] = fetched.get(pKey)
 
             for r in reqs:
                 req_name = r["name"]
@@ -335,34 +545,41 @@ class Operations:
                     unsatisfied_dependencies.add(req_name)
                     continue
 
-                providers: List[Dict[str, Any]] = []
-                for pKey in provider_keys:
-                    prov_row = self.db.get_by_key(pKey, repo_filter=repo_ids)
-                    if prov_row:
-                        providers.append(prov_row)
+                providers = [prov_row for pKey in provider_keys if (prov_row := rows_by_key[pKey])]
 
                 if not providers:
                     unsatisfied_dependencies.add(req_name)
                     continue
 
-                best = max(providers, key=lambda r: NEVRA.from_row(r))
+                best = max(providers, key=NEVRA.row_key)
                 dep_map[pkgKey].append(best)
+                satisfied[pkgKey].add(best["name"])
 
                 if recursive is not None:
-                    if best["pkgKey"] not in resolved_keys:
+                    bestKey = best["pkgKey"]
+                    if bestKey not in resolved_keys and bestKey not in queued:
                         if depth is None or depth < 0:
                             next_depth = -1
+                            queued.add(bestKey)
                         else:
+                            # limited depth: the latest push is popped first and decides the depth, keep it
                             next_depth = depth - 1
                         stack.append((best, next_depth))
 
-        resolved_rows = [self.db.get_by_key(k, repo_filter=repo_ids) for k in resolved_keys]
-        resolved_rows = [r for r in resolved_rows if r is not None]
+        order = _dependency_order(to_resolve, dep_map, resolved_keys)
+        resolved_rows = [row for k in order if (row := rows_by_key.get(k))]
+        if leaf_requires:
+            # resolve() reports unsatisfied requirements for every resolved package, expanded or not
+            leaves = [k for k in resolved_keys if k not in requires_map]
+            if leaves:
+                load_requires(leaves)
 
         return {
             "resolved_rows": resolved_rows,
             "dep_map": dep_map,
+            "satisfied": satisfied,
             "unsatisfied": unsatisfied_dependencies,
+            "requires_map": requires_map,
         }
 
     def resolve(
@@ -374,30 +591,39 @@ class Operations:
         arch: Optional[str] = None,
         verbose: bool = False,
     ) -> None:
-        result = self._resolve_dependencies(packages, repo, weakdeps, recursive, arch)
+        result = self._resolve_dependencies(packages, repo, weakdeps, recursive, arch, leaf_requires=True)
         resolved = result["resolved_rows"]
         dep_map = result["dep_map"]
-        unsatisfied = result["unsatisfied"]
+        satisfied_map = result["satisfied"]
         if not resolved:
             _logger.info("No packages resolved.")
             return
         printed_keys: Set[int] = set()
         printed_unsatisfied: Set[str] = set()
-        requires_map = self.db.requires_map()
+        requires_map = result["requires_map"]
+        # the same dependency rows recur under many packages: build each NEVRA once
+        nevras: Dict[int, NEVRA] = {}
+
+        def nevra_of(row: Dict[str, Any]) -> NEVRA:
+            key = row["pkgKey"]
+            nevra = nevras.get(key)
+            if nevra is None:
+                nevra = nevras[key] = NEVRA.from_row(row)
+            return nevra
+
         for pkg_row in resolved:
             pkgKey = pkg_row["pkgKey"]
-            pkg_nevra = NEVRA.from_row(pkg_row)
+            pkg_nevra = nevra_of(pkg_row)
             deps = dep_map.get(pkgKey, [])
-            satisfied = {dep["name"] for dep in deps}
-            all_reqs = {r["name"] for r in requires_map.get(pkgKey, [])}
-            unsat_for_pkg = all_reqs - satisfied
+            all_reqs = {r["name"] for r in requires_map.get(pkgKey, ())}
+            unsat_for_pkg = all_reqs.difference(satisfied_map.get(pkgKey, ()))
             if verbose:
                 self.print_delimiter()
                 print(f"Package: {pkg_nevra}")
                 if deps:
                     print("Requires:")
                     for dep_row in deps:
-                        dep_nevra = NEVRA.from_row(dep_row)
+                        dep_nevra = nevra_of(dep_row)
                         print(f"  - {dep_row['name']} provided by {dep_nevra}")
                 elif not unsat_for_pkg:
                     print("Requires: <no dependencies>")
@@ -411,7 +637,7 @@ class Operations:
                 depKey = dep_row["pkgKey"]
                 if depKey not in printed_keys:
                     if not verbose:
-                        print(f"- {NEVRA.from_row(dep_row)}")
+                        print(f"- {nevra_of(dep_row)}")
                     printed_keys.add(depKey)
         if not verbose and printed_unsatisfied:
             _logger.warning("unsatisfied dependencies: %s", ", ".join(sorted(printed_unsatisfied)))
@@ -428,6 +654,7 @@ class Operations:
         source: bool = False,
         urls: bool = False,
         arch: Optional[str] = None,
+        hardlink: bool = False,
     ) -> None:
         if resolve_flag or recurse:
             result = self._resolve_dependencies(packages, repo=repo, weakdeps=False, recursive=recurse, arch=arch)
@@ -439,23 +666,26 @@ class Operations:
 
             targets: Dict[int, Dict[str, Any]] = {r["pkgKey"]: r for r in resolved_rows}
             for deps in dep_map.values():
-                for dep_row in deps:
-                    targets[dep_row["pkgKey"]] = dep_row
+                targets.update((dep_row["pkgKey"], dep_row) for dep_row in deps)
             targets_list = list(targets.values())
         else:
-            targets_list = []
+            targets = {}
             repo_ids = self._resolve_repo_names_to_ids(repo)
+            queries: Dict[str, str] = {}
             for p in packages:
                 try:
                     nv = NEVRA.parse(p)
                 except Exception:
                     nv = None
-                rows = self.db.search_packages(str(nv) if nv else p, repo_filter=repo_ids, exact=True)
-                if not rows:
+                queries[p] = str(nv) if nv else p
+            best_rows = self.db.latest_packages_many(list(queries.values()), repo_filter=repo_ids)
+            for p in packages:
+                best = best_rows[queries[p]]
+                if best is None:
                     _logger.warning("No match found for package: %s", p)
                     continue
-                best = max(rows, key=lambda r: NEVRA.from_row(r))
-                targets_list.append(best)
+                targets.setdefault(best["pkgKey"], best)
+            targets_list = list(targets.values())
 
         if not targets_list:
             _logger.info("No packages selected for download.")
@@ -467,62 +697,101 @@ class Operations:
         if dest_dir:
             dest_dir.mkdir(parents=True, exist_ok=True)
 
+        # repo_id -> base URL without trailing '/' (None: repo gone), normalized once per repo
+        repo_bases: Dict[int, Optional[str]] = {
+            repo_id: repo_row["base_url"].rstrip("/")
+            for repo_id, repo_row in self.db.get_repos_by_ids(int(r["repo_id"]) for r in targets_list).items()
+        }
+
         def build_urls_for_row(row: Dict[str, Any]) -> List[str]:
+            # rows always come from the packages table: location_base / location_href are the only spellings
+            lh = row.get("location_href")
+            if not lh:
+                return []
+            lh = lh.lstrip("/")
             urls_list: List[str] = []
-            lb = row.get("location_base") or row.get("locationbase") or row.get("location_base_url")
-            lh = row.get("location_href") or row.get("locationhref") or row.get("href")
-            if lb and lh:
-                urls_list.append(f"{lb.rstrip('/')}/{lh.lstrip('/')}")
-            repo_row = self.db.get_repo(int(row["repo_id"]))
-            if repo_row and lh:
-                urls_list.append(f"{repo_row['base_url'].rstrip('/')}/{lh.lstrip('/')}")
+            lb = row.get("location_base")
+            if lb:
+                urls_list.append(f"{lb.rstrip('/')}/{lh}")
+            repo_id = int(row["repo_id"])
+            if repo_id not in repo_bases:
+                # e.g. SRPM rows from a repo that holds none of the targets
+                repo_row = self.db.get_repo(repo_id)
+                repo_bases[repo_id] = repo_row["base_url"].rstrip("/") if repo_row else None
+            base = repo_bases[repo_id]
+            if base is not None:
+                urls_list.append(f"{base}/{lh}")
             return urls_list
 
         if urls:
             for row in targets_list:
-                nevra = NEVRA.from_row(row)
                 ulist = build_urls_for_row(row)
                 if not ulist:
-                    _logger.info("%s -> no URL available", nevra)
+                    _logger.info("%s -> no URL available", NEVRA.from_row(row))
                 else:
                     for u in ulist:
                         print(u)
             return
 
+        # outpath -> (url, nevra): DB lookups and URL building stay on this thread, only transfers are pooled.
+        # Keyed by output file so two workers never write the same file (e.g. an SRPM shared by several targets).
+        jobs: Dict[Path, tuple[str, NEVRA]] = {}
+        src_rows_by_name: Dict[str, List[Dict[str, Any]]] = {}
+        if source:
+            # one batched lookup for all source RPMs instead of a query per target
+            src_names = [row["rpm_sourcerpm"] for row in targets_list if row.get("rpm_sourcerpm")]
+            src_rows_by_name = self.db.search_packages_many(src_names, repo_filter=None, exact=True)
         for row in targets_list:
             nevra = NEVRA.from_row(row)
             candidates = [row]
             if source and row.get("rpm_sourcerpm"):
-                src_rows = self.db.search_packages(row["rpm_sourcerpm"], repo_filter=None, exact=True)
-                candidates.extend(src_rows)
+                candidates.extend(src_rows_by_name[row["rpm_sourcerpm"]])
 
             for pkg_row in candidates:
+                pkg_nevra = nevra if pkg_row is row else NEVRA.from_row(pkg_row)
                 urls_list = build_urls_for_row(pkg_row)
                 if not urls_list:
-                    _logger.warning("Skipping %s: no URL available", NEVRA.from_row(pkg_row))
+                    _logger.warning("Skipping %s: no URL available", pkg_nevra)
                     continue
 
                 url = urls_list[0]
-                filename = url.split("/")[-1] or f"{NEVRA.from_row(pkg_row).to_nvra()}.rpm"
-                outpath = download_dir / filename
+                filename = url.split("/")[-1] or f"{pkg_nevra.to_nvra()}.rpm"
+                jobs.setdefault(download_dir / filename, (url, pkg_nevra))
 
-                try:
-                    if hasattr(self.downloader, "download_to_file"):
-                        self.downloader.download_to_file(url, outpath)
-                    else:
-                        data = self.downloader.download_to_memory(url)
-                        with open(outpath, "wb") as fh:
-                            fh.write(data)
-                    _logger.info("Downloaded %s -> %s", NEVRA.from_row(pkg_row), outpath)
-
-                    if dest_dir:
-                        final = dest_dir / filename
-                        try:
-                            import shutil
-
-                            shutil.copy2(outpath, final)
+        def fetch(outpath: Path, url: str, pkg_nevra: NEVRA, progress: bool = True) -> None:
+            try:
+                # streamed straight to disk: an RPM is never held in memory as a whole
+                self.downloader.download_to_file(url, outpath, progress=progress)
+                _logger.info("Downloaded %s -> %s", pkg_nevra, outpath)
+
+                if dest_dir:
+                    final = dest_dir / outpath.name
+                    try:
+                        staged = _stage_file(outpath, final, link=hardlink)
+                        if staged == "present":
+                            _logger.info("Already in place: %s", final)
+                        elif staged == "linked":
+                            _logger.info("Linked to %s", final)
+                        else:
                             _logger.info("Copied to %s", final)
-                        except Exception as e:
-                            _logger.error("Failed to copy %s: %s", final, e)
-                except Exception as e:
-                    _logger.exception("Download failed for %s: %s", NEVRA.from_row(pkg_row), e)
+                    except Exception as e:
+                        _logger.error("Failed to copy %s: %s", final, e)
+            except Exception as e:
+                _logger.exception("Download failed for %s: %s", pkg_nevra, e)
+
+        # RPM transfers are network-bound; the PowerShell backend draws a console spinner, so it stays sequential.
+        workers = _DOWNLOAD_WORKERS if self.downloader.backend == DownloaderType.PYTHON else 1
+        workers = min(workers, len(jobs))
+        if workers <= 1:
+            for outpath, (url, pkg_nevra) in jobs.items():
+                fetch(outpath, url, pkg_nevra)
+            return
+
+        # Concurrent per-file bars would overwrite each other: show one bar for the whole batch and
+        # route log records through tqdm.write() so they print above it instead of through it.
+        with logging_redirect_tqdm(loggers=[logging.getLogger("windnf")]), tqdm(
+            total=len(jobs), unit="pkg", desc="Downloading", disable=is_dumb_terminal()
+        ) as bar, ThreadPoolExecutor(max_workers=workers) as ex:
+            futures = [ex.submit(fetch, outpath, url, pkg_nevra, False) for outpath, (url, pkg_nevra) in jobs.items()]
+            for _ in as_completed(futures):
+                bar.update(1)
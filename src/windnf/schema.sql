@@ -190,6 +190,9 @@ CREATE INDEX IF NOT EXISTS idx_repo_name ON repositories (name);
 CREATE INDEX IF NOT EXISTS packagename ON packages (name);
 CREATE INDEX IF NOT EXISTS packageId ON packages (pkgId);
 CREATE INDEX IF NOT EXISTS pkg_repo ON packages (repo_id);
+-- case-insensitive: lets prefix LIKE searches ('bash%') seek instead of scanning
+CREATE INDEX IF NOT EXISTS packagename_nocase ON packages (name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS packagesummary_nocase ON packages (summary COLLATE NOCASE);
 
 -- primary: files + relations
 CREATE INDEX IF NOT EXISTS filenames ON files (name);
@@ -0,0 +1,115 @@
+"""
+Offline fixtures for the unit tests: a throwaway HOME/config and small repodata
+sqlite files imported into the unified DB, no network access needed.
+"""
+
+import io
+import logging
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+from windnf.config import Config
+from windnf.operations import Operations
+
+# keep expected warnings (default config written, SSL verification off) out of the test output
+logging.getLogger("windnf").addHandler(logging.NullHandler())
+
+PRIMARY_SCHEMA = """
+CREATE TABLE packages (pkgKey INTEGER PRIMARY KEY, pkgId TEXT, name TEXT, arch TEXT, version TEXT, epoch TEXT,
+  release TEXT, summary TEXT, description TEXT, url TEXT, time_file INTEGER, time_build INTEGER, rpm_license TEXT,
+  rpm_vendor TEXT, rpm_group TEXT, rpm_buildhost TEXT, rpm_sourcerpm TEXT, rpm_header_start INTEGER,
+  rpm_header_end INTEGER, rpm_packager TEXT, size_package INTEGER, size_installed INTEGER, size_archive INTEGER,
+  location_href TEXT, location_base TEXT, checksum_type TEXT);
+CREATE TABLE provides (name TEXT, flags TEXT, epoch TEXT, version TEXT, release TEXT, pkgKey INTEGER);
+CREATE TABLE requires (name TEXT, flags TEXT, epoch TEXT, version TEXT, release TEXT, pkgKey INTEGER,
+  pre BOOLEAN DEFAULT FALSE);
+CREATE TABLE files (name TEXT, type TEXT, pkgKey INTEGER);
+"""
+
+
+def pkg(name, version="1.0", release="1", epoch="0", arch="x86_64", summary=None, sourcerpm=None):
+    """Package row for make_primary(); every package provides its own name."""
+    return {
+        "name": name,
+        "version": version,
+        "release": release,
+        "epoch": epoch,
+        "arch": arch,
+        "summary": summary if summary is not None else f"{name} package",
+        "sourcerpm": sourcerpm,
+    }
+
+
+def make_primary(path, packages, provides=(), requires=()):
+    """
+    Write a minimal primary.sqlite. `provides` / `requires` are (capability, package index) pairs,
+    indexes are 0-based positions in `packages`.
+    """
+    conn = sqlite3.connect(str(path))
+    conn.executescript(PRIMARY_SCHEMA)
+    for key, p in enumerate(packages, 1):
+        href = f"Packages/{p['name']}-{p['version']}-{p['release']}.{p['arch']}.rpm"
+        conn.execute(
+            "INSERT INTO packages (pkgKey, pkgId, name, arch, version, epoch, release, summary, rpm_sourcerpm,"
+            " location_href) VALUES (?,?,?,?,?,?,?,?,?,?)",
+            (
+                key,
+                f"id-{key}-{p['name']}",
+                p["name"],
+                p["arch"],
+                p["version"],
+                p["epoch"],
+                p["release"],
+                p["summary"],
+                p["sourcerpm"],
+                href,
+            ),
+        )
+        conn.execute("INSERT INTO provides (name, pkgKey) VALUES (?, ?)", (p["name"], key))
+        conn.execute("INSERT INTO files (name, type, pkgKey) VALUES (?, ?, ?)", (f"/usr/bin/{p['name']}", "file", key))
+    for cap, idx in provides:
+        conn.execute("INSERT INTO provides (name, pkgKey) VALUES (?, ?)", (cap, idx + 1))
+    for cap, idx in requires:
+        conn.execute("INSERT INTO requires (name, pkgKey) VALUES (?, ?)", (cap, idx + 1))
+    conn.commit()
+    conn.close()
+
+
+class WindnfTestCase(unittest.TestCase):
+    """Operations instance backed by a fresh DB under a temporary HOME."""
+
+    downloader = "python"
+
+    def setUp(self):
+        self.home = Path(tempfile.mkdtemp(prefix="windnf-test-"))
+        env = mock.patch.dict(os.environ, {"HOME": str(self.home), "USERPROFILE": str(self.home)})
+        env.start()
+        self.addCleanup(env.stop)
+        self.addCleanup(shutil.rmtree, self.home, True)
+
+        self.config = Config()
+        self.config.downloader = self.downloader
+        self.config.download_path = self.home / "downloads"
+        self.ops = Operations(self.config)
+        self.db = self.ops.db
+        self.addCleanup(self.db.conn.close)
+
+    def add_repo(self, name, packages, provides=(), requires=(), rtype="binary"):
+        """Register repo `name` and import the given packages into it."""
+        primary = self.home / f"{name}-primary.sqlite"
+        make_primary(primary, packages, provides, requires)
+        self.db.add_repo(name, f"http://mirror.test/{name}", "repodata/repomd.xml", rtype=rtype)
+        self.db.import_repodb(primary, name)
+
+    def capture(self, fn, *args, **kwargs):
+        """Run fn and return what it printed to stdout."""
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            fn(*args, **kwargs)
+        return buf.getvalue()
@@ -0,0 +1,149 @@
+import functools
+import random
+import unittest
+
+from support import WindnfTestCase, pkg
+
+from windnf.nevra import NEVRA, rpmvercmp
+
+
+class PackageQueryTest(WindnfTestCase):
+    def setUp(self):
+        super().setUp()
+        self.add_repo("base", [pkg("bash"), pkg("bash-completion"), pkg("zsh", summary="Shell like bash")])
+
+    def query_plan(self, pattern):
+        where, params = self.db._package_filter(pattern, None, exact=False)
+        sql = "EXPLAIN QUERY PLAN SELECT * FROM packages WHERE " + " AND ".join(where)
+        return " | ".join(r["detail"] for r in self.db.conn.execute(sql, params))
+
+    def test_prefix_glob_seeks_both_nocase_indexes(self):
+        # name LIKE 'bash%' OR summary LIKE 'bash%': the OR is only served by indexes if both sides have one
+        plan = self.query_plan("bash*")
+        self.assertIn("MULTI-INDEX OR", plan)
+        self.assertIn("USING INDEX packagename_nocase", plan)
+        self.assertIn("USING INDEX packagesummary_nocase", plan)
+        rows = self.db.search_packages("BASH*")
+        self.assertEqual(sorted(r["name"] for r in rows), ["bash", "bash-completion"])
+
+
+class SearchPackagesManyTest(WindnfTestCase):
+    def setUp(self):
+        super().setUp()
+        self.add_repo(
+            "base",
+            [
+                pkg("bash", "5.1.8", "6.el9", summary="The GNU Bourne Again shell"),
+                pkg("bash", "5.1.8", "9.el9", summary="The GNU Bourne Again shell"),
+                pkg("vlc", epoch="1", summary="Multimedia player"),
+                pkg("glibc", summary="The GNU libc libraries"),
+            ],
+        )
+        self.add_repo("extra", [pkg("bash", "5.2.15", summary="The GNU Bourne Again shell"), pkg("fish")])
+        self.repo_ids = [r["id"] for r in self.db.list_repos()]
+        self.patterns = ["bash", "*ash", "bash*", "vlc", "nomatch", "bash", "shell", "bash-0:5.1.8-6.el9.x86_64", "x"]
+
+    def test_matches_one_query_per_pattern(self):
+        # small limits force several UNION ALL batches, including single-pattern ones
+        for limits in ((900, 400), (7, 2), (3, 1)):
+            for repo_filter in (None, self.repo_ids[:1], self.repo_ids):
+                for exact in (False, True):
+                    with self.subTest(limits=limits, repo_filter=repo_filter, exact=exact):
+                        self.db._MAX_QUERY_PARAMS, self.db._MAX_COMPOUND_TERMS = limits
+                        many = self.db.search_packages_many(self.patterns, repo_filter=repo_filter, exact=exact)
+                        self.assertEqual(set(many), set(self.patterns))
+                        for pat in self.patterns:
+                            expected = self.db.search_packages(pat, repo_filter=repo_filter, exact=exact)
+                            self.assertEqual(many[pat], expected, pat)
+
+    def test_more_patterns_than_one_compound_select(self):
+        patterns = [f"p{i}" for i in range(self.db._MAX_COMPOUND_TERMS + 50)] + ["bash"]
+        many = self.db.search_packages_many(patterns)
+        self.assertEqual(len(many["bash"]), 3)
+        self.assertFalse(any(many[p] for p in patterns[:-1]))
+
+
+class LatestPackageTest(WindnfTestCase):
+    def add_versions(self, name, evrs):
+        self.db.add_repo(name, f"http://mirror.test/{name}", "repodata/repomd.xml")
+        repo_id = self.db.get_repo(name)["id"]
+        for epoch, version, release in evrs:
+            self.db.insert_package(
+                repo_id,
+                {"pkgId": "x", "name": name, "arch": "x86_64", "epoch": epoch, "version": version, "release": release},
+            )
+
+    def latest_evr(self, name):
+        row = self.db.latest_packages_many([name])[name]
+        return row["epoch"], row["version"], row["release"]
+
+    def test_rpm_version_order(self):
+        cases = {
+            # numeric chunks compare as numbers, not strings
+            "numeric": [("0", "2.9", "1"), ("0", "2.10", "1")],
+            # epoch wins over any version
+            "epoch": [("1", "1.0", "1"), ("0", "9.9", "1")],
+            "release": [("0", "1.0", "9.el9"), ("0", "1.0", "10.el9")],
+            # the longer version wins when all shared chunks are equal
+            "longer": [("0", "1.0.1", "1"), ("0", "1.0", "1")],
+        }
+        expected = {
+            "numeric": ("0", "2.10", "1"),
+            "epoch": ("1", "1.0", "1"),
+            "release": ("0", "1.0", "10.el9"),
+            "longer": ("0", "1.0.1", "1"),
+        }
+        for name, evrs in cases.items():
+            self.add_versions(name, evrs)
+        for name in cases:
+            with self.subTest(name=name):
+                self.assertEqual(self.latest_evr(name), expected[name])
+
+    def test_collation_sorts_like_rpmvercmp(self):
+        versions = ["1.10", "1.9", "1.0~rc1", "1.0", "1.0a", "1.0.1", "", "2", "10", "1.01", "el9", "1_2", "1+2"]
+        rows = self.db.conn.execute(
+            "SELECT v FROM ("
+            + " UNION ALL ".join("SELECT ? AS v" for _ in versions)
+            + ") ORDER BY v COLLATE rpmvercmp",
+            versions,
+        )
+        self.assertEqual([r["v"] for r in rows], sorted(versions, key=functools.cmp_to_key(rpmvercmp)))
+
+    def test_agrees_with_python_max_randomized(self):
+        rng = random.Random(3)
+        chunks = ["1", "2", "10", "0", "a", "b", "~", "rc1", "el9", ".", "_", "+", "01"]
+
+        def evr_part():
+            return "".join(rng.choice(chunks) for _ in range(rng.randint(0, 4))) or rng.choice(["1", None, ""])
+
+        repo_ids = []
+        for repo in ("a", "b"):
+            self.db.add_repo(repo, f"http://mirror.test/{repo}", "repodata/repomd.xml")
+            repo_ids.append(self.db.get_repo(repo)["id"])
+        names = [f"p{i}" for i in range(20)]
+        with self.db.conn:
+            for _ in range(1500):
+                self.db._insert_package_row(
+                    rng.choice(repo_ids),
+                    {
+                        "pkgId": "x",
+                        "name": rng.choice(names),
+                        "arch": rng.choice(["x86_64", "noarch", None, "i686"]),
+                        "epoch": rng.choice([None, "0", "1", "2", "", "10"]),
+                        "version": evr_part(),
+                        "release": evr_part(),
+                    },
+                )
+
+        patterns = names + ["nope", "p1"]
+        for repo_filter in (None, repo_ids[:1], repo_ids[1:]):
+            many = self.db.latest_packages_many(patterns, repo_filter=repo_filter)
+            for name in patterns:
+                with self.subTest(name=name, repo_filter=repo_filter):
+                    rows = self.db.search_packages(name, repo_filter=repo_filter, exact=True)
+                    expected = max(rows, key=NEVRA.row_key) if rows else None
+                    self.assertEqual(many[name], expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
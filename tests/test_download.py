@@ -0,0 +1,98 @@
+import os
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from support import WindnfTestCase, pkg
+
+
+def fake_download(url, output_path, progress=True):
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(url)
+
+
+class DownloadTest(WindnfTestCase):
+    def setUp(self):
+        super().setUp()
+        self.add_repo("base", [pkg("foo"), pkg("bar")])
+        self.cache = self.home / "cache"
+        self.dest = self.home / "dest"
+        patcher = mock.patch.object(self.ops.downloader, "download_to_file", side_effect=fake_download)
+        self.download_to_file = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_destdir_gets_independent_copies_by_default(self):
+        self.ops.download(["foo"], downloaddir=str(self.cache), destdir=str(self.dest))
+        cached, staged = self.cache / "foo-1.0-1.x86_64.rpm", self.dest / "foo-1.0-1.x86_64.rpm"
+        self.assertEqual(staged.read_text(), "http://mirror.test/base/Packages/foo-1.0-1.x86_64.rpm")
+        self.assertFalse(os.path.samefile(cached, staged))
+        # editing the staged file must not touch the cached download
+        staged.write_text("edited")
+        self.assertEqual(cached.read_text(), "http://mirror.test/base/Packages/foo-1.0-1.x86_64.rpm")
+
+    def test_hardlink_shares_the_cached_file(self):
+        self.ops.download(["foo"], downloaddir=str(self.cache), destdir=str(self.dest), hardlink=True)
+        cached, staged = self.cache / "foo-1.0-1.x86_64.rpm", self.dest / "foo-1.0-1.x86_64.rpm"
+        self.assertTrue(os.path.samefile(cached, staged))
+
+    def test_destdir_equal_to_downloaddir_is_not_reported_as_linked(self):
+        with self.assertLogs("windnf", level="INFO") as logs:
+            self.ops.download(["foo"], downloaddir=str(self.cache), destdir=str(self.cache))
+        staged = [m for m in logs.output if str(self.cache / "foo-1.0-1.x86_64.rpm") in m and "->" not in m]
+        self.assertEqual(len(staged), 1)
+        self.assertIn("Already in place", staged[0])
+
+    def test_concurrent_downloads_use_one_aggregate_bar(self):
+        self.ops.download(["foo", "bar"], downloaddir=str(self.cache))
+        self.assertEqual(sorted(p.name for p in self.cache.iterdir()), ["bar-1.0-1.x86_64.rpm", "foo-1.0-1.x86_64.rpm"])
+        self.assertEqual(self.download_to_file.call_count, 2)
+        # per-file bars are off while several workers run
+        for call in self.download_to_file.call_args_list:
+            self.assertIs(call.kwargs["progress"], False)
+
+    def test_single_download_keeps_its_own_bar(self):
+        self.ops.download(["foo"], downloaddir=str(self.cache))
+        self.download_to_file.assert_called_once()
+        self.assertIs(self.download_to_file.call_args.kwargs["progress"], True)
+
+    def test_duplicate_targets_are_fetched_once(self):
+        self.ops.download(["foo", "foo-0:1.0-1.x86_64"], downloaddir=str(self.cache))
+        self.download_to_file.assert_called_once()
+
+    def test_source_lookups_are_batched(self):
+        self.add_repo(
+            "updates",
+            [pkg("one", sourcerpm="one-1.0-1.src.rpm"), pkg("two", sourcerpm="two-1.0-1.src.rpm"), pkg("three")],
+        )
+        with mock.patch.object(self.db, "search_packages", wraps=self.db.search_packages) as single, mock.patch.object(
+            self.db, "search_packages_many", wraps=self.db.search_packages_many
+        ) as many:
+            self.ops.download(["one", "two", "three"], downloaddir=str(self.cache), source=True)
+        single.assert_not_called()
+        many.assert_called_once()
+        self.assertEqual(many.call_args.args[0], ["one-1.0-1.src.rpm", "two-1.0-1.src.rpm"])
+        self.assertEqual(many.call_args.kwargs, {"repo_filter": None, "exact": True})
+        self.assertEqual(self.download_to_file.call_count, 3)
+
+
+class PowershellDownloadTest(WindnfTestCase):
+    downloader = "powershell"
+
+    def test_powershell_backend_downloads_sequentially(self):
+        self.add_repo("base", [pkg("foo"), pkg("bar")])
+        threads = []
+
+        def record(url, output_path, progress=True):
+            threads.append(threading.get_ident())
+            fake_download(url, output_path)
+
+        with mock.patch.object(self.ops.downloader, "download_to_file", side_effect=record) as download_to_file:
+            self.ops.download(["foo", "bar"], downloaddir=str(self.home / "cache"))
+        self.assertEqual(download_to_file.call_count, 2)
+        self.assertEqual(set(threads), {threading.get_ident()})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import sqlite3
+import unittest
+
+from support import WindnfTestCase, make_primary, pkg
+
+
+class ImportRepodbTest(WindnfTestCase):
+    def test_copies_relations_and_optional_tables(self):
+        primary = self.home / "primary.sqlite"
+        make_primary(primary, [pkg("foo"), pkg("bar")], provides=[("libfoo.so", 0)], requires=[("libfoo.so", 1)])
+        conn = sqlite3.connect(str(primary))
+        conn.executescript("""
+            CREATE TABLE filelist (pkgKey INTEGER, dirname TEXT, filenames TEXT, filetypes TEXT);
+            INSERT INTO filelist VALUES (1, '/usr/bin', 'foo', 'f'), (99, '/orphan', 'x', 'f');
+            CREATE TABLE changelog (pkgKey INTEGER, author TEXT, date INTEGER, changelog TEXT);
+            INSERT INTO changelog VALUES (2, 'packager', 1700000000, '- rebuilt');
+            """)
+        conn.commit()
+        conn.close()
+        self.db.add_repo("base", "http://mirror.test/base", "repodata/repomd.xml")
+        self.db.import_repodb(primary, "base")
+
+        keys = {r["name"]: r["pkgKey"] for r in self.db.conn.execute("SELECT name, pkgKey FROM packages")}
+        self.assertEqual(self.db.provides_for(["libfoo.so"]), {"libfoo.so": {keys["foo"]}})
+        self.assertEqual([r["name"] for r in self.db.requires_for([keys["bar"]])[keys["bar"]]], ["libfoo.so"])
+        files = self.db.conn.execute("SELECT name, pkgKey FROM files ORDER BY name").fetchall()
+        self.assertEqual([tuple(r) for r in files], [("/usr/bin/bar", keys["bar"]), ("/usr/bin/foo", keys["foo"])])
+        # rows pointing at packages that were not imported are dropped
+        filelist = self.db.conn.execute("SELECT pkgKey, dirname FROM filelist").fetchall()
+        self.assertEqual([tuple(r) for r in filelist], [(keys["foo"], "/usr/bin")])
+        changelog = self.db.conn.execute("SELECT pkgKey, author, changelog FROM changelog").fetchall()
+        self.assertEqual([tuple(r) for r in changelog], [(keys["bar"], "packager", "- rebuilt")])
+
+    def _pragma(self, name):
+        return self.db.conn.execute(f"PRAGMA {name}").fetchone()[0]
+
+    def test_bulk_import_never_shrinks_cache_and_restores_pragmas(self):
+        # the configured 100000 pages are already above the bulk size: left alone
+        self.db.begin_bulk_import()
+        self.assertEqual(self._pragma("cache_size"), 100000)
+        self.db.end_bulk_import()
+        self.assertEqual(self._pragma("cache_size"), 100000)
+
+        self.db.conn.execute("PRAGMA cache_size=2000")
+        mmap_size = self._pragma("mmap_size")
+        self.db.begin_bulk_import()
+        self.assertEqual(self.db._cache_bytes(self._pragma("cache_size")), self.db._BULK_CACHE_BYTES)
+        self.db.end_bulk_import()
+        self.assertEqual(self._pragma("cache_size"), 2000)
+        self.assertEqual(self._pragma("mmap_size"), mmap_size)
+
+    def _index_names(self):
+        return {r["name"] for r in self.db.conn.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+
+    def test_indexes_deferred_only_while_db_is_empty(self):
+        deferred = set(self.db.BULK_DEFERRED_INDEXES)
+        self.db.begin_bulk_import()
+        self.assertFalse(deferred & self._index_names())
+        self.db.end_bulk_import()
+        self.assertLessEqual(deferred, self._index_names())
+
+        self.add_repo("base", [pkg("foo")])
+        self.assertLessEqual(deferred, self._index_names())
+
+        # later imports keep the indexes instead of rebuilding them over every loaded repo
+        self.db.begin_bulk_import()
+        try:
+            self.assertLessEqual(deferred, self._index_names())
+        finally:
+            self.db.end_bulk_import()
+        self.add_repo("extra", [pkg("bar")])
+        self.assertLessEqual(deferred, self._index_names())
+        self.assertEqual(self.db.conn.execute("SELECT count(*) FROM packages").fetchone()[0], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,18 @@
+import unittest
+from unittest import mock
+
+from support import WindnfTestCase
+
+
+class ReposyncTest(WindnfTestCase):
+    def test_repo_named_twice_is_synced_once(self):
+        self.db.add_repo("base", "http://mirror.test/base", "repodata/repomd.xml")
+        self.db.add_repo("extra", "http://mirror.test/extra", "repodata/repomd.xml")
+        base_id = self.db.get_repo("base")["id"]
+        with mock.patch.object(self.ops.metadata, "sync_repo") as sync_repo:
+            self.ops.reposync(["base", "extra", "base", str(base_id)], all_=False)
+        self.assertEqual(sorted(c.args[0]["name"] for c in sync_repo.call_args_list), ["base", "extra"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import unittest
+from unittest import mock
+
+from support import WindnfTestCase, pkg
+
+from windnf.nevra import NEVRA
+
+
+class ResolveTest(WindnfTestCase):
+    def setUp(self):
+        super().setUp()
+        self.add_repo(
+            "base",
+            [
+                pkg("app"),
+                pkg("core"),
+                pkg("libc", "2.9"),
+                pkg("libc", "2.10"),
+                pkg("tool"),
+            ],
+            provides=[("libcore.so", 1), ("libc.so.6", 2), ("libc.so.6", 3)],
+            requires=[("libcore.so", 0), ("libmissing.so", 0), ("libc.so.6", 1), ("libc.so.6", 4)],
+        )
+        self.keys = {
+            (r["name"], r["version"]): r["pkgKey"]
+            for r in self.db.conn.execute("SELECT name, version, pkgKey FROM packages")
+        }
+
+    def resolved(self, packages, **kwargs):
+        result = self.ops._resolve_dependencies(packages, **kwargs)
+        return [(r["name"], r["version"]) for r in result["resolved_rows"]], result
+
+    def test_recursive_closure_in_dependency_order(self):
+        rows, result = self.resolved(["app"], recursive=-1)
+        # newest provider by rpm version order (2.10 > 2.9), dependencies before dependents
+        self.assertEqual(rows, [("libc", "2.10"), ("core", "1.0"), ("app", "1.0")])
+        self.assertEqual(result["unsatisfied"], {"libmissing.so"})
+
+    def test_depth_limits(self):
+        rows, result = self.resolved(["app"])
+        self.assertEqual(rows, [("app", "1.0")])
+        self.assertEqual([r["name"] for r in result["dep_map"][self.keys[("app", "1.0")]]], ["core"])
+
+        rows, _ = self.resolved(["app"], recursive=1)
+        self.assertEqual(rows, [("core", "1.0"), ("app", "1.0")])
+
+    def test_overlapping_patterns_resolve_each_package_once(self):
+        rows, _ = self.resolved(["tool", "app", "tool"], recursive=-1)
+        self.assertEqual(sorted(rows), [("app", "1.0"), ("core", "1.0"), ("libc", "2.10"), ("tool", "1.0")])
+        self.assertEqual(len(rows), len(set(rows)))
+
+    def test_repo_filter_limits_providers(self):
+        self.add_repo("extra", [pkg("libc", "3.0")], provides=[("libc.so.6", 0)])
+        rows, _ = self.resolved(["core"], recursive=-1)
+        self.assertIn(("libc", "3.0"), rows)
+        rows, _ = self.resolved(["core"], recursive=-1, repo=["base"])
+        self.assertIn(("libc", "2.10"), rows)
+        self.assertNotIn(("libc", "3.0"), rows)
+
+    def test_requires_loaded_lazily(self):
+        app, core = self.keys[("app", "1.0")], self.keys[("core", "1.0")]
+        with mock.patch.object(self.db, "requires_for", wraps=self.db.requires_for) as requires_for:
+            self.capture(self.ops.download, ["app"], recurse=1, urls=True)
+        # core is resolved but not expanded: download does not report its requirements, resolve() does
+        self.assertEqual([list(c.args[0]) for c in requires_for.call_args_list], [[app]])
+
+        with mock.patch.object(self.db, "requires_for", wraps=self.db.requires_for) as requires_for:
+            out = self.capture(self.ops.resolve, ["app"], recursive=1)
+        self.assertEqual(sorted(k for c in requires_for.call_args_list for k in c.args[0]), sorted([app, core]))
+        self.assertIn("core-0:1.0-1.x86_64", out)
+
+
+class BatchedLookupTest(WindnfTestCase):
+    def setUp(self):
+        super().setUp()
+        self.add_repo("base", [pkg("foo", "1.0"), pkg("foo", "1.2"), pkg("bar", "2.0", epoch="1"), pkg("baz")])
+        self.patterns = ["foo", "bar", "nope", "foo"]
+
+    def test_requested_packages_use_one_batched_query(self):
+        with mock.patch.object(self.db, "latest_packages_many", wraps=self.db.latest_packages_many) as many:
+            rows = self.ops._resolve_dependencies(self.patterns)["resolved_rows"]
+        many.assert_called_once()
+        self.assertEqual(list(many.call_args.args[0]), self.patterns)
+        self.assertEqual(sorted((r["name"], r["version"]) for r in rows), [("bar", "2.0"), ("foo", "1.2")])
+
+    def test_batched_rows_match_newest_search_result(self):
+        many = self.db.latest_packages_many(self.patterns)
+        for pat in self.patterns:
+            rows = self.db.search_packages(pat, exact=True)
+            self.assertEqual(many[pat], max(rows, key=NEVRA.row_key) if rows else None, pat)
+        self.assertIsNone(many["nope"])
+
+    def test_info_and_download_urls_use_the_batch(self):
+        with mock.patch.object(self.db, "latest_packages_many", wraps=self.db.latest_packages_many) as many:
+            info = self.capture(self.ops.info, ["foo", "baz"])
+            urls = self.capture(self.ops.download, ["foo", "baz"], urls=True)
+        self.assertEqual([list(c.args[0]) for c in many.call_args_list], [["foo", "baz"], ["foo", "baz"]])
+        self.assertIn("1.2", info)
+        self.assertEqual(
+            urls.split(),
+            [
+                "http://mirror.test/base/Packages/foo-1.2-1.x86_64.rpm",
+                "http://mirror.test/base/Packages/baz-1.0-1.x86_64.rpm",
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
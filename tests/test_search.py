@@ -0,0 +1,60 @@
+import unittest
+
+from support import WindnfTestCase, pkg
+
+
+class SearchTest(WindnfTestCase):
+    def setUp(self):
+        super().setUp()
+        self.add_repo(
+            "base",
+            [
+                pkg("bash", "5.1.8", "6.el9", summary="The GNU Bourne Again shell"),
+                pkg("bash", "5.1.8", "9.el9", summary="The GNU Bourne Again shell"),
+                pkg("etude", summary="ÉTUDE tool"),
+                pkg("zsh", "5.8", summary="Powerful interactive shell"),
+            ],
+        )
+
+    def test_non_ascii_uppercase_query(self):
+        # SQL LOWER() only folds ASCII: matching must lowercase both sides in Python
+        for pattern in ("É", "ÉTUDE", "*É*"):
+            with self.subTest(pattern=pattern):
+                out = self.capture(self.ops.search, [pattern])
+                self.assertIn("etude-0:1.0-1.x86_64", out)
+                self.assertIn("Summary Matched", out)
+
+    def test_fnmatch_globs_classify_rows_found_by_other_patterns(self):
+        # LIKE treats '?' and '[...]' literally, so only "*sh" selects bash in SQL;
+        # the fnmatch classification still lists it under the other globs.
+        for glob in ("b?sh*", "[bz]ash*"):
+            with self.subTest(glob=glob):
+                out = self.capture(self.ops.search, ["*sh", glob])
+                self.assertIn(f"Name Matched: {glob}", out)
+                section = out.split(f"Name Matched: {glob}", 1)[1]
+                self.assertIn("bash-0:5.1.8-9.el9.x86_64", section)
+
+    def test_multiple_patterns_each_get_their_sections(self):
+        out = self.capture(self.ops.search, ["bash", "shell", "nomatch"])
+        self.assertIn("Name Matched: bash", out)
+        self.assertIn("Summary Matched: shell", out)
+        self.assertNotIn(": nomatch", out)
+
+    def test_prefix_glob_lists_rows_in_table_order(self):
+        # bash* is answered from the NOCASE indexes, which return "bash-aa" before "bash-zz"
+        self.add_repo("extra", [pkg("bash-zz"), pkg("bash-aa")])
+        out = self.capture(self.ops.search, ["bash-*"])
+        self.assertLess(out.index("bash-zz-0:1.0-1"), out.index("bash-aa-0:1.0-1"))
+
+    def test_latest_only_unless_showduplicates(self):
+        out = self.capture(self.ops.search, ["bash"])
+        self.assertIn("bash-0:5.1.8-9.el9.x86_64", out)
+        self.assertNotIn("bash-0:5.1.8-6.el9.x86_64", out)
+
+        out = self.capture(self.ops.search, ["bash"], showduplicates=True)
+        self.assertIn("bash-0:5.1.8-6.el9.x86_64", out)
+        self.assertIn("bash-0:5.1.8-9.el9.x86_64", out)
+
+
+if __name__ == "__main__":
+    unittest.main()